@@ -1,8 +1,11 @@
 import os
 import re
-import json
 from pathlib import Path
 
+_VERSION_KEY = '\nversion = "'
+_MP_META_RE = re.compile(r'("metadata"\s*:\s*\{[^}]*?"version"\s*:\s*")[^"]*(")')
+_MP_PLUGIN_RE = re.compile(r'("name"\s*:\s*"nwave"[^}]*?"version"\s*:\s*")[^"]*(")')
+
 def update_version():
     run_number = os.environ.get("GITHUB_RUN_NUMBER")
     if not run_number:
@@ -13,32 +16,32 @@ def update_version():
     pyproject_path = Path("pyproject.toml")
     content = pyproject_path.read_text(encoding="utf-8")
     
-    # Extract current major version
-    match = re.search(r'version = "(\d+)\.(\d+)\.(\d+)"', content)
-    if not match:
+    # Locate the version line by its literal prefix and slice out the major
+    start = content.find(_VERSION_KEY)
+    end = content.find('"', start + len(_VERSION_KEY)) if start != -1 else -1
+    major = content[start + len(_VERSION_KEY):end].split(".", 1)[0]
+    if end == -1 or not major.isdigit():
         print("Could not find version in pyproject.toml")
         return
-        
-    major = match.group(1)
+
     # Format: MAJOR.RUN_NUMBER.0
     new_version = f"{major}.{run_number}.0"
-    
+
     print(f"Updating version to {new_version}")
-    
-    new_content = re.sub(r'version = ".*"', f'version = "{new_version}"', content)
+
+    new_content = f"{content[:start]}{_VERSION_KEY}{new_version}{content[end:]}"
     pyproject_path.write_text(new_content, encoding="utf-8")
     
     # Update marketplace.json
     marketplace_path = Path(".github/plugin/marketplace.json")
     if marketplace_path.exists():
-        data = json.loads(marketplace_path.read_text(encoding="utf-8"))
-        data["metadata"]["version"] = new_version
+        # Patch the two version strings in place so the file's formatting is kept
+        content = marketplace_path.read_text(encoding="utf-8")
+        content = _MP_META_RE.sub(rf"\g<1>{new_version}\g<2>", content, count=1)
         # Update specific plugin version too
-        for plugin in data.get("plugins", []):
-            if plugin["name"] == "nwave":
-                plugin["version"] = new_version
-        
-        marketplace_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        content = _MP_PLUGIN_RE.sub(rf"\g<1>{new_version}\g<2>", content)
+
+        marketplace_path.write_text(content, encoding="utf-8")
 
 if __name__ == "__main__":
     update_version()
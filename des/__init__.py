@@ -27,40 +27,83 @@ New code should import from the specific layer packages:
   - from des.adapters.driven import EnvironmentConfigAdapter
 """
 
-# Re-export all key classes for backward compatibility
-from des.adapters.driven import (
-    ClaudeCodeTaskAdapter,
-    EnvironmentConfigAdapter,
-    InMemoryConfigAdapter,
-    MockedTaskAdapter,
-    RealFileSystem,
-    SilentLogger,
-    StructuredLogger,
-    SystemTimeProvider,
-)
-from des.application.config_loader import ConfigLoader
-from des.application.orchestrator import DESOrchestrator, HookPort
-from des.application.validator import TDDPhaseValidator, TemplateValidator
-from des.domain import (
-    InvocationLimitsResult,
-    InvocationLimitsValidator,
-    TimeoutMonitor,
-    TurnCounter,
-)
-from des.ports.driven_ports import (
-    ConfigPort,
-    FileSystemPort,
-    LoggingPort,
-    TaskInvocationPort,
-    TimeProvider,
-)
-from des.ports.driver_ports import ValidatorPort
+from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from des._lazy import lazy_exports
+
+
+if TYPE_CHECKING:
+    from des.adapters.driven import (
+        ClaudeCodeTaskAdapter,
+        EnvironmentConfigAdapter,
+        InMemoryConfigAdapter,
+        MockedTaskAdapter,
+        RealFileSystem,
+        SilentLogger,
+        StructuredLogger,
+        SystemTimeProvider,
+    )
+    from des.application.config_loader import ConfigLoader
+    from des.application.orchestrator import DESOrchestrator, HookPort
+    from des.application.validator import TDDPhaseValidator, TemplateValidator
+    from des.domain import (
+        InvocationLimitsResult,
+        InvocationLimitsValidator,
+        TimeoutMonitor,
+        TurnCounter,
+    )
+    from des.ports.driven_ports import (
+        ConfigPort,
+        FileSystemPort,
+        LoggingPort,
+        TaskInvocationPort,
+        TimeProvider,
+    )
+    from des.ports.driver_ports import ValidatorPort
+
+    # Backward compatibility aliases
+    RealValidator = TemplateValidator
+    RealFilesystem = RealFileSystem
+    SystemTime = SystemTimeProvider
+
+
+# Re-exports are resolved lazily (PEP 562) so that importing a single
+# submodule, e.g. a hook adapter, does not load the whole package graph.
+# name -> (module, attribute); aliases point at their original attribute.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "ClaudeCodeTaskAdapter": ("des.adapters.driven", "ClaudeCodeTaskAdapter"),
+    "EnvironmentConfigAdapter": ("des.adapters.driven", "EnvironmentConfigAdapter"),
+    "InMemoryConfigAdapter": ("des.adapters.driven", "InMemoryConfigAdapter"),
+    "MockedTaskAdapter": ("des.adapters.driven", "MockedTaskAdapter"),
+    "RealFileSystem": ("des.adapters.driven", "RealFileSystem"),
+    "SilentLogger": ("des.adapters.driven", "SilentLogger"),
+    "StructuredLogger": ("des.adapters.driven", "StructuredLogger"),
+    "SystemTimeProvider": ("des.adapters.driven", "SystemTimeProvider"),
+    "ConfigLoader": ("des.application.config_loader", "ConfigLoader"),
+    "DESOrchestrator": ("des.application.orchestrator", "DESOrchestrator"),
+    "HookPort": ("des.application.orchestrator", "HookPort"),
+    "TDDPhaseValidator": ("des.application.validator", "TDDPhaseValidator"),
+    "TemplateValidator": ("des.application.validator", "TemplateValidator"),
+    "InvocationLimitsResult": ("des.domain", "InvocationLimitsResult"),
+    "InvocationLimitsValidator": ("des.domain", "InvocationLimitsValidator"),
+    "TimeoutMonitor": ("des.domain", "TimeoutMonitor"),
+    "TurnCounter": ("des.domain", "TurnCounter"),
+    "ConfigPort": ("des.ports.driven_ports", "ConfigPort"),
+    "FileSystemPort": ("des.ports.driven_ports", "FileSystemPort"),
+    "LoggingPort": ("des.ports.driven_ports", "LoggingPort"),
+    "TaskInvocationPort": ("des.ports.driven_ports", "TaskInvocationPort"),
+    "TimeProvider": ("des.ports.driven_ports", "TimeProvider"),
+    "ValidatorPort": ("des.ports.driver_ports", "ValidatorPort"),
+    # Backward compatibility aliases
+    "RealValidator": ("des.application.validator", "TemplateValidator"),
+    "RealFilesystem": ("des.adapters.driven", "RealFileSystem"),
+    "SystemTime": ("des.adapters.driven", "SystemTimeProvider"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
-# Backward compatibility aliases
-RealValidator = TemplateValidator
-RealFilesystem = RealFileSystem
-SystemTime = SystemTimeProvider
 
 __all__ = [
     "ClaudeCodeTaskAdapter",
@@ -0,0 +1,46 @@
+"""Lazy (PEP 562) re-exports for package ``__init__`` modules.
+
+Resolving re-exports on first access means importing a single submodule,
+e.g. a hook adapter, does not load the whole package graph.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    module_name: str, exports: Mapping[str, tuple[str, str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build a package's module-level ``__getattr__`` and ``__dir__``.
+
+    Each resolved value is stored in the package namespace, so later
+    lookups are plain attribute hits that skip ``__getattr__``.
+
+    Args:
+        module_name: ``__name__`` of the re-exporting package
+        exports: Exported name -> (source module, attribute in that module)
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level
+    """
+    namespace = sys.modules[module_name].__dict__
+
+    def __getattr__(name: str) -> Any:
+        try:
+            source, attribute = exports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(source), attribute)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -6,16 +6,38 @@ for both production and test environments. Organized into driver (inbound)
 and driven (outbound) adapters following hexagonal architecture.
 """
 
-from des.adapters.driven import (
-    ClaudeCodeTaskAdapter,
-    EnvironmentConfigAdapter,
-    InMemoryConfigAdapter,
-    MockedTaskAdapter,
-    RealFileSystem,
-    SilentLogger,
-    StructuredLogger,
-    SystemTime,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from des._lazy import lazy_exports
+
+
+if TYPE_CHECKING:
+    from des.adapters.driven import (
+        ClaudeCodeTaskAdapter,
+        EnvironmentConfigAdapter,
+        InMemoryConfigAdapter,
+        MockedTaskAdapter,
+        RealFileSystem,
+        SilentLogger,
+        StructuredLogger,
+        SystemTime,
+    )
+
+
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "ClaudeCodeTaskAdapter": ("des.adapters.driven", "ClaudeCodeTaskAdapter"),
+    "EnvironmentConfigAdapter": ("des.adapters.driven", "EnvironmentConfigAdapter"),
+    "InMemoryConfigAdapter": ("des.adapters.driven", "InMemoryConfigAdapter"),
+    "MockedTaskAdapter": ("des.adapters.driven", "MockedTaskAdapter"),
+    "RealFileSystem": ("des.adapters.driven", "RealFileSystem"),
+    "SilentLogger": ("des.adapters.driven", "SilentLogger"),
+    "StructuredLogger": ("des.adapters.driven", "StructuredLogger"),
+    "SystemTime": ("des.adapters.driven", "SystemTime"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 
 __all__ = [
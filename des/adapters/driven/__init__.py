@@ -5,29 +5,82 @@ Exports all driven adapter implementations for configuration, filesystem,
 logging, task invocation, and time provision.
 """
 
-from des.adapters.driven.config.environment_config_adapter import (
-    EnvironmentConfigAdapter,
-)
-from des.adapters.driven.config.in_memory_config_adapter import (
-    InMemoryConfigAdapter,
-)
-from des.adapters.driven.filesystem.real_filesystem import RealFileSystem
-from des.adapters.driven.logging.silent_logger import SilentLogger
-from des.adapters.driven.logging.structured_logger import StructuredLogger
-from des.adapters.driven.task_invocation.claude_code_task_adapter import (
-    ClaudeCodeTaskAdapter,
-)
-from des.adapters.driven.task_invocation.mocked_task_adapter import (
-    MockedTaskAdapter,
-)
-from des.adapters.driven.time.system_time import SystemTimeProvider
-from des.adapters.driven.validation.git_scope_checker import GitScopeChecker
-from des.ports.driven_ports.scope_checker import ScopeCheckResult
-
-
-# Backward compatibility aliases
-RealFilesystem = RealFileSystem
-SystemTime = SystemTimeProvider
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from des._lazy import lazy_exports
+
+
+if TYPE_CHECKING:
+    from des.adapters.driven.config.environment_config_adapter import (
+        EnvironmentConfigAdapter,
+    )
+    from des.adapters.driven.config.in_memory_config_adapter import (
+        InMemoryConfigAdapter,
+    )
+    from des.adapters.driven.filesystem.real_filesystem import RealFileSystem
+    from des.adapters.driven.logging.silent_logger import SilentLogger
+    from des.adapters.driven.logging.structured_logger import StructuredLogger
+    from des.adapters.driven.task_invocation.claude_code_task_adapter import (
+        ClaudeCodeTaskAdapter,
+    )
+    from des.adapters.driven.task_invocation.mocked_task_adapter import (
+        MockedTaskAdapter,
+    )
+    from des.adapters.driven.time.system_time import SystemTimeProvider
+    from des.adapters.driven.validation.git_scope_checker import GitScopeChecker
+    from des.ports.driven_ports.scope_checker import ScopeCheckResult
+
+    # Backward compatibility aliases
+    RealFilesystem = RealFileSystem
+    SystemTime = SystemTimeProvider
+
+
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "EnvironmentConfigAdapter": (
+        "des.adapters.driven.config.environment_config_adapter",
+        "EnvironmentConfigAdapter",
+    ),
+    "InMemoryConfigAdapter": (
+        "des.adapters.driven.config.in_memory_config_adapter",
+        "InMemoryConfigAdapter",
+    ),
+    "RealFileSystem": (
+        "des.adapters.driven.filesystem.real_filesystem",
+        "RealFileSystem",
+    ),
+    "SilentLogger": ("des.adapters.driven.logging.silent_logger", "SilentLogger"),
+    "StructuredLogger": (
+        "des.adapters.driven.logging.structured_logger",
+        "StructuredLogger",
+    ),
+    "ClaudeCodeTaskAdapter": (
+        "des.adapters.driven.task_invocation.claude_code_task_adapter",
+        "ClaudeCodeTaskAdapter",
+    ),
+    "MockedTaskAdapter": (
+        "des.adapters.driven.task_invocation.mocked_task_adapter",
+        "MockedTaskAdapter",
+    ),
+    "SystemTimeProvider": (
+        "des.adapters.driven.time.system_time",
+        "SystemTimeProvider",
+    ),
+    "GitScopeChecker": (
+        "des.adapters.driven.validation.git_scope_checker",
+        "GitScopeChecker",
+    ),
+    "ScopeCheckResult": ("des.ports.driven_ports.scope_checker", "ScopeCheckResult"),
+    "RealFilesystem": (
+        "des.adapters.driven.filesystem.real_filesystem",
+        "RealFileSystem",
+    ),
+    "SystemTime": ("des.adapters.driven.time.system_time", "SystemTimeProvider"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
 
 __all__ = [
     # Task invocation adapters
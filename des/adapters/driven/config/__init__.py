@@ -1,12 +1,35 @@
 """Config driven adapters."""
 
-from des.adapters.driven.config.des_config import DESConfig
-from des.adapters.driven.config.environment_config_adapter import (
-    EnvironmentConfigAdapter,
-)
-from des.adapters.driven.config.in_memory_config_adapter import (
-    InMemoryConfigAdapter,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from des._lazy import lazy_exports
+
+
+if TYPE_CHECKING:
+    from des.adapters.driven.config.des_config import DESConfig
+    from des.adapters.driven.config.environment_config_adapter import (
+        EnvironmentConfigAdapter,
+    )
+    from des.adapters.driven.config.in_memory_config_adapter import (
+        InMemoryConfigAdapter,
+    )
+
+
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "DESConfig": ("des.adapters.driven.config.des_config", "DESConfig"),
+    "EnvironmentConfigAdapter": (
+        "des.adapters.driven.config.environment_config_adapter",
+        "EnvironmentConfigAdapter",
+    ),
+    "InMemoryConfigAdapter": (
+        "des.adapters.driven.config.in_memory_config_adapter",
+        "InMemoryConfigAdapter",
+    ),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 
 __all__ = ["DESConfig", "EnvironmentConfigAdapter", "InMemoryConfigAdapter"]
@@ -11,10 +11,28 @@ Hexagonal Architecture:
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
+_TRUE_VALUES = frozenset({"true", "1", "yes"})
+
+
+@lru_cache(maxsize=16)
+def _load_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Parse a config file, memoized by its stat signature.
+
+    The mtime and size are part of the cache key so an edited file is
+    re-read on the next lookup. Callers must treat the result as read-only.
+    """
+    try:
+        return json.loads(Path(path).read_bytes())
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+
 class DESConfig:
     """
     Configuration loader for DES settings.
@@ -42,6 +60,7 @@ class DESConfig:
 
         self._config_path = config_path
         self._config_data = self._load_configuration()
+        self._audit_logging_enabled: bool | None = None
 
     def _load_configuration(self) -> dict[str, Any]:
         """
@@ -50,14 +69,13 @@ class DESConfig:
         Returns:
             Configuration dictionary, empty dict if loading fails
         """
-        if not self._config_path.exists():
-            return {}
-
         try:
-            return json.loads(self._config_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            stat = self._config_path.stat()
+        except OSError:
             return {}
 
+        return _load_cached(str(self._config_path), stat.st_mtime_ns, stat.st_size)
+
     @property
     def audit_logging_enabled(self) -> bool:
         """
@@ -68,7 +86,32 @@ class DESConfig:
         Returns:
             True if audit logging enabled, False otherwise (defaults to True)
         """
-        env_override = os.environ.get("DES_AUDIT_LOGGING_ENABLED")
+        if self._audit_logging_enabled is None:
+            env_override = os.environ.get("DES_AUDIT_LOGGING_ENABLED")
+            if env_override is not None:
+                self._audit_logging_enabled = (
+                    env_override == "true" or env_override.lower() in _TRUE_VALUES
+                )
+            else:
+                self._audit_logging_enabled = self._config_data.get(
+                    "audit_logging_enabled", True
+                )
+        return self._audit_logging_enabled
+
+    @property
+    def diagnostics_verbose(self) -> bool:
+        """
+        Check if verbose hook diagnostics are enabled.
+
+        When disabled, hooks skip HOOK_COMPLETED on the empty-stdin fast path,
+        which is already recorded by its HOOK_PROTOCOL_ANOMALY event.
+
+        Priority: DES_DIAGNOSTICS_VERBOSE env var > config file > default (False).
+
+        Returns:
+            True if verbose diagnostics enabled, False otherwise (defaults to False)
+        """
+        env_override = os.environ.get("DES_DIAGNOSTICS_VERBOSE")
         if env_override is not None:
-            return env_override.lower() in ("true", "1", "yes")
-        return self._config_data.get("audit_logging_enabled", True)
+            return env_override.lower() in _TRUE_VALUES
+        return bool(self._config_data.get("diagnostics_verbose", False))
@@ -16,11 +16,18 @@ class EnvironmentConfigAdapter(ConfigPort):
 
     Provides fallback defaults when environment variables are not set,
     ensuring the system can operate even without explicit configuration.
+    Values are parsed on first access and memoized for the adapter's lifetime.
     """
 
     def __init__(self):
         """Initialize the environment config adapter."""
-        pass
+        self._max_turns: int | None = None
+        self._timeout_threshold: int | None = None
+
+    def reset(self) -> None:
+        """Discard memoized values so the next access re-reads the environment."""
+        self._max_turns = None
+        self._timeout_threshold = None
 
     def get_max_turns_default(self) -> int:
         """
@@ -32,7 +39,9 @@ class EnvironmentConfigAdapter(ConfigPort):
         Returns:
             int: Maximum turns default (from env or fallback of 30)
         """
-        return int(os.environ.get("DES_MAX_TURNS_DEFAULT", "30"))
+        if self._max_turns is None:
+            self._max_turns = int(os.environ.get("DES_MAX_TURNS_DEFAULT", "30"))
+        return self._max_turns
 
     def get_timeout_threshold_default(self) -> int:
         """
@@ -43,4 +52,8 @@ class EnvironmentConfigAdapter(ConfigPort):
         Returns:
             int: Timeout threshold in seconds (from env or fallback of 600)
         """
-        return int(os.environ.get("DES_TIMEOUT_THRESHOLD_DEFAULT", "600"))
+        if self._timeout_threshold is None:
+            self._timeout_threshold = int(
+                os.environ.get("DES_TIMEOUT_THRESHOLD_DEFAULT", "600")
+            )
+        return self._timeout_threshold
@@ -1,6 +1,8 @@
 """Test implementation of filesystem adapter."""
 
+import copy
 from pathlib import Path
+from types import MappingProxyType
 
 from des.ports.driven_ports.filesystem_port import FileSystemPort
 
@@ -9,16 +11,21 @@ class InMemoryFileSystem(FileSystemPort):
     """In-memory filesystem for testing.
 
     Provides fast, deterministic file operations without touching disk.
-    Files are stored in memory dictionary keyed by absolute path.
+    Files are stored in memory dictionary keyed by the absolute path string,
+    which hashes and compares faster than Path objects.
     """
 
     def __init__(self):
         """Initialize empty in-memory filesystem."""
-        self._files: dict[Path, dict] = {}
+        self._files: dict[str, dict] = {}
 
     def read_json(self, path: Path) -> dict:
         """Read JSON from in-memory storage.
 
+        Returns a deep copy so mutations by the caller, including nested
+        ones, do not leak into the stored file, matching a real re-read
+        from disk.
+
         Args:
             path: Absolute path to JSON file
 
@@ -28,9 +35,29 @@ class InMemoryFileSystem(FileSystemPort):
         Raises:
             FileNotFoundError: If file doesn't exist in memory
         """
-        if path not in self._files:
-            raise FileNotFoundError(f"File not found: {path}")
-        return self._files[path]
+        return copy.deepcopy(self._read(path))
+
+    def read_json_readonly(self, path: Path) -> MappingProxyType:
+        """Read JSON from in-memory storage as a zero-copy read-only view.
+
+        Convenience method for test assertions.
+
+        Args:
+            path: Absolute path to JSON file
+
+        Returns:
+            Read-only mapping over the stored data
+
+        Raises:
+            FileNotFoundError: If file doesn't exist in memory
+        """
+        return MappingProxyType(self._read(path))
+
+    def _read(self, path: Path) -> dict:
+        try:
+            return self._files[str(path)]
+        except KeyError:
+            raise FileNotFoundError(f"File not found: {path}") from None
 
     def write_json(self, path: Path, data: dict) -> None:
         """Write JSON to in-memory storage.
@@ -39,7 +66,7 @@ class InMemoryFileSystem(FileSystemPort):
             path: Absolute path to target JSON file
             data: Dictionary to store
         """
-        self._files[path] = data
+        self._files[str(path)] = data
 
     def exists(self, path: Path) -> bool:
         """Check if path exists in memory.
@@ -50,7 +77,7 @@ class InMemoryFileSystem(FileSystemPort):
         Returns:
             True if path exists in in-memory filesystem
         """
-        return path in self._files
+        return str(path) in self._files
 
     def seed_file(self, path: Path, data: dict) -> None:
         """Seed in-memory filesystem with test data.
@@ -61,7 +88,7 @@ class InMemoryFileSystem(FileSystemPort):
             path: Absolute path where file should exist
             data: JSON data to store at that path
         """
-        self._files[path] = data
+        self._files[str(path)] = data
 
     def clear(self) -> None:
         """Clear all files from in-memory filesystem.
@@ -78,4 +105,4 @@ class InMemoryFileSystem(FileSystemPort):
         Returns:
             List of all paths currently stored
         """
-        return list(self._files.keys())
+        return [Path(key) for key in self._files]
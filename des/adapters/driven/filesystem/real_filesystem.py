@@ -25,18 +25,19 @@ class RealFileSystem(FileSystemPort):
             FileNotFoundError: If file doesn't exist
             JSONDecodeError: If file is not valid JSON
         """
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        return json.loads(path.read_bytes())
 
     def write_json(self, path: Path, data: dict) -> None:
         """Write data as formatted JSON file.
 
+        The document is serialized in one shot and written with a single
+        call, rather than streamed to the file chunk by chunk.
+
         Args:
             path: Absolute path to target JSON file
             data: Dictionary to write as JSON
         """
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        path.write_bytes(json.dumps(data, indent=2).encode("utf-8"))
 
     def exists(self, path: Path) -> bool:
         """Check if path exists.
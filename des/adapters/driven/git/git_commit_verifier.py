@@ -28,6 +28,8 @@ class GitCommitVerifier(CommitVerifier):
 
         Uses git log --grep to search commit messages for the Step-ID trailer.
         Searches the full message (subject + body), not just the subject line.
+        The trailer is matched as a fixed string, so git skips regex
+        compilation and step IDs are never interpreted as patterns.
 
         Args:
             step_id: Step identifier to search for (e.g., "01-01")
@@ -42,6 +44,7 @@ class GitCommitVerifier(CommitVerifier):
                     "git",
                     "log",
                     "--format=%H|%ai|%s",
+                    "--fixed-strings",
                     f"--grep=Step-ID: {step_id}",
                     "-1",
                 ],
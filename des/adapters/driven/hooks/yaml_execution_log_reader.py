@@ -13,6 +13,9 @@ The application layer only sees PhaseEvent domain objects.
 
 from __future__ import annotations
 
+import os
+from dataclasses import dataclass
+
 import yaml
 
 from des.domain.phase_event import PhaseEvent, PhaseEventParser
@@ -23,6 +26,21 @@ from des.ports.driven_ports.execution_log_reader import (
 )
 
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+@dataclass(frozen=True)
+class _ParsedLog:
+    """Execution log parsed once, with events pre-indexed by step_id."""
+
+    project_id: str | None
+    all_events: list[PhaseEvent]
+    events_by_step: dict[str, list[PhaseEvent]]
+
+
 class YamlExecutionLogReader(ExecutionLogReader):
     """Reads execution log data from YAML files.
 
@@ -42,6 +60,8 @@ class YamlExecutionLogReader(ExecutionLogReader):
 
     def __init__(self) -> None:
         self._parser = PhaseEventParser()
+        # log_path -> ((st_mtime_ns, st_size), parsed log); re-parsed on change
+        self._cache: dict[str, tuple[tuple[int, int], _ParsedLog]] = {}
 
     def read_project_id(self, log_path: str) -> str | None:
         """Read the project_id from the execution log.
@@ -56,8 +76,7 @@ class YamlExecutionLogReader(ExecutionLogReader):
             LogFileNotFound: If the log file does not exist
             LogFileCorrupted: If the log file cannot be parsed
         """
-        data = self._load_yaml(log_path)
-        return data.get("project_id")
+        return self._load_log(log_path).project_id
 
     def read_step_events(self, log_path: str, step_id: str) -> list[PhaseEvent]:
         """Read and parse phase events for a specific step.
@@ -76,9 +95,7 @@ class YamlExecutionLogReader(ExecutionLogReader):
             LogFileNotFound: If the log file does not exist
             LogFileCorrupted: If the log file cannot be parsed
         """
-        data = self._load_yaml(log_path)
-        raw_events = data.get("events", [])
-        return self._parser.parse_many(raw_events, step_id)
+        return list(self._load_log(log_path).events_by_step.get(step_id, ()))
 
     def read_all_events(self, log_path: str) -> list[PhaseEvent]:
         """Read and parse all phase events without step_id filtering.
@@ -93,26 +110,37 @@ class YamlExecutionLogReader(ExecutionLogReader):
             LogFileNotFound: If the log file does not exist
             LogFileCorrupted: If the log file cannot be parsed
         """
-        data = self._load_yaml(log_path)
-        raw_events = data.get("events", [])
-        return self._parser.parse_all(raw_events)
+        return list(self._load_log(log_path).all_events)
+
+    def _load_log(self, log_path: str) -> _ParsedLog:
+        """Load and parse a YAML file, reusing the last parse while unchanged.
 
-    def _load_yaml(self, log_path: str) -> dict:
-        """Load and parse a YAML file.
+        Events are parsed once and indexed by step_id so repeated per-step
+        reads of the same log are dictionary lookups.
 
         Args:
             log_path: Absolute path to the YAML file
 
         Returns:
-            Parsed YAML data as a dictionary
+            Parsed log with project_id and indexed PhaseEvent objects
 
         Raises:
             LogFileNotFound: If the file does not exist
             LogFileCorrupted: If the YAML cannot be parsed
         """
         try:
-            with open(log_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            stat = os.stat(log_path)
+        except FileNotFoundError:
+            raise LogFileNotFound(f"Execution log not found: {log_path}")
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(log_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        try:
+            with open(log_path, "rb") as f:
+                data = yaml.load(f.read(), Loader=_SafeLoader)
         except FileNotFoundError:
             raise LogFileNotFound(f"Execution log not found: {log_path}")
         except yaml.YAMLError as e:
@@ -123,4 +151,9 @@ class YamlExecutionLogReader(ExecutionLogReader):
                 f"Execution log must be a YAML mapping, got {type(data).__name__}"
             )
 
-        return data
+        all_events = self._parser.parse_all(data.get("events") or [])
+        events_by_step = self._parser.index_by_step(all_events)
+
+        parsed = _ParsedLog(data.get("project_id"), all_events, events_by_step)
+        self._cache[log_path] = (signature, parsed)
+        return parsed
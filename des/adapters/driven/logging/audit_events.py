@@ -8,7 +8,8 @@ Defines standardized event categories:
 - COMMIT: Git commit events
 """
 
-from dataclasses import asdict, dataclass
+import copy
+from dataclasses import dataclass, fields
 from enum import Enum
 from typing import Any
 
@@ -45,7 +46,10 @@ class EventType(Enum):
     HOOK_SUBAGENT_STOP_FAILED = "HOOK_SUBAGENT_STOP_FAILED"
 
 
-@dataclass
+_EVENT_VALUES: frozenset[str] = frozenset(e.value for e in EventType)
+
+
+@dataclass(slots=True)
 class AuditEvent:
     """Structured audit event with complete execution context."""
 
@@ -65,11 +69,18 @@ class AuditEvent:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization.
 
-        Excludes None values for cleaner JSONL output.
+        Excludes None values for cleaner JSONL output. All other fields
+        are scalars, so only extra_context, whose values are arbitrary, is
+        deep-copied, matching asdict() without its recursion over fields.
         """
-        data = asdict(self)
-        # Remove None values
-        return {k: v for k, v in data.items() if v is not None}
+        data = {}
+        for name in _AUDIT_EVENT_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        if self.extra_context is not None:
+            data["extra_context"] = copy.deepcopy(self.extra_context)
+        return data
 
     @staticmethod
     def from_dict(data: dict[str, Any]) -> "AuditEvent":
@@ -84,6 +95,12 @@ class AuditEvent:
         return AuditEvent(**data)
 
 
+# extra_context is deep-copied separately in to_dict()
+_AUDIT_EVENT_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in fields(AuditEvent) if f.name != "extra_context"
+)
+
+
 def validate_event_type(event_type: str) -> bool:
     """Validate that event type is in allowed categories.
 
@@ -93,7 +110,30 @@ def validate_event_type(event_type: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    return any(e.value == event_type for e in EventType)
+    return event_type in _EVENT_VALUES
+
+
+_CATEGORY_PREFIXES = (
+    "TASK_INVOCATION",
+    "PHASE",
+    "SUBAGENT_STOP",
+    "COMMIT",
+    "VALIDATION",
+    "HOOK",
+)
+
+
+def _category_by_prefix(event_type: str) -> str:
+    for prefix in _CATEGORY_PREFIXES:
+        if event_type.startswith(prefix):
+            return prefix
+    return "UNKNOWN"
+
+
+# Known event types resolve with a single dict lookup
+_EVENT_CATEGORIES: dict[str, str] = {
+    e.value: _category_by_prefix(e.value) for e in EventType
+}
 
 
 def get_event_category(event_type: str) -> str:
@@ -105,17 +145,7 @@ def get_event_category(event_type: str) -> str:
     Returns:
         Event category (e.g., 'TASK_INVOCATION')
     """
-    if event_type.startswith("TASK_INVOCATION"):
-        return "TASK_INVOCATION"
-    elif event_type.startswith("PHASE"):
-        return "PHASE"
-    elif event_type.startswith("SUBAGENT_STOP"):
-        return "SUBAGENT_STOP"
-    elif event_type.startswith("COMMIT"):
-        return "COMMIT"
-    elif event_type.startswith("VALIDATION"):
-        return "VALIDATION"
-    elif event_type.startswith("HOOK"):
-        return "HOOK"
-    else:
-        return "UNKNOWN"
+    category = _EVENT_CATEGORIES.get(event_type)
+    if category is None:
+        category = _category_by_prefix(event_type)
+    return category
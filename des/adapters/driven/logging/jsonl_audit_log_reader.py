@@ -7,17 +7,26 @@ Uses the same log directory resolution as JsonlAuditLogWriter.
 from __future__ import annotations
 
 import json
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+import os
+import sys
+import time
+from typing import TYPE_CHECKING, Any, BinaryIO
 
-from des.domain.audit_log_path_resolver import AuditLogPathResolver
+from des.domain.audit_log_path_resolver import resolve_audit_log_dir
 from des.ports.driven_ports.audit_log_reader import AuditLogReader
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 
+_BLOCK_SIZE = 64 * 1024
+
+# Low-cardinality fields whose values are interned after parsing
+_INTERNED_FIELDS = ("event", "feature_name", "step_id", "hook_id")
+
+
 class JsonlAuditLogReader(AuditLogReader):
     """Reads audit events from JSONL files.
 
@@ -28,8 +37,10 @@ class JsonlAuditLogReader(AuditLogReader):
     def __init__(
         self, log_dir: str | Path | None = None, cwd: str | Path | None = None
     ) -> None:
-        resolved = AuditLogPathResolver(log_dir=log_dir, cwd=cwd).resolve()
+        resolved = resolve_audit_log_dir(log_dir=log_dir, cwd=cwd)
         self._log_dir = resolved
+        self._today = ""
+        self._today_path: Path | None = None
 
     def read_last_entry(
         self,
@@ -48,25 +59,82 @@ class JsonlAuditLogReader(AuditLogReader):
         if log_file is None or not log_file.exists():
             return None
 
+        probes = self._build_probes(event_type, feature_name, step_id)
+
         try:
-            lines = log_file.read_text().strip().splitlines()
+            with open(log_file, "rb") as f:
+                for line in self._iter_lines_backward(f):
+                    # Cheap substring pre-filter: skip parsing lines that
+                    # cannot match
+                    if probes and not all(p in line for p in probes):
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if not isinstance(entry, dict):
+                        continue
+                    self._intern_fields(entry)
+
+                    if self._matches(entry, event_type, feature_name, step_id):
+                        return entry
         except (OSError, PermissionError):
             return None
 
-        # Scan backward for most recent match
-        for line in reversed(lines):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+        return None
 
-            if self._matches(entry, event_type, feature_name, step_id):
-                return entry
+    @staticmethod
+    def _build_probes(*filters: str | None) -> list[bytes]:
+        """Build byte substrings that any matching raw line must contain.
 
-        return None
+        Each filter value must appear in the line as a JSON string literal.
+        Only plain ASCII values are probed: their encoding is the same with
+        or without ensure_ascii and regardless of separator whitespace, so
+        a probe can never reject a line that would have matched.
+        """
+        probes = []
+        for value in filters:
+            if (
+                value
+                and value.isascii()
+                and value.isprintable()
+                and '"' not in value
+                and "\\" not in value
+            ):
+                probes.append(b'"' + value.encode("ascii") + b'"')
+        return probes
+
+    @staticmethod
+    def _iter_lines_backward(f: BinaryIO) -> Iterator[bytes]:
+        """Yield non-empty lines from the end of a file towards the start.
+
+        Reads fixed-size blocks from the tail, so memory is bounded by the
+        block size plus the longest line rather than by the file size.
+        """
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            read_size = min(_BLOCK_SIZE, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            # The first piece may continue in the previous block
+            remainder = lines[0]
+            for line in reversed(lines[1:]):
+                line = line.strip()
+                if line:
+                    yield line
+        remainder = remainder.strip()
+        if remainder:
+            yield remainder
+
+    @staticmethod
+    def _intern_fields(entry: dict[str, Any]) -> None:
+        """Intern enum-like string values so repeats share one object."""
+        for key in _INTERNED_FIELDS:
+            value = entry.get(key)
+            if type(value) is str:
+                entry[key] = sys.intern(value)
 
     def _matches(
         self,
@@ -86,5 +154,8 @@ class JsonlAuditLogReader(AuditLogReader):
         """Get today's log file path, or None if dir doesn't exist."""
         if not self._log_dir.exists():
             return None
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        return self._log_dir / f"audit-{today}.log"
+        today = time.strftime("%Y-%m-%d", time.gmtime())
+        if today != self._today or self._today_path is None:
+            self._today = today
+            self._today_path = self._log_dir / f"audit-{today}.log"
+        return self._today_path
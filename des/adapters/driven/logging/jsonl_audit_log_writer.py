@@ -17,11 +17,13 @@ Features removed (no longer needed):
 
 from __future__ import annotations
 
+import atexit
 import json
-from datetime import datetime, timezone
+import os
+import time
 from typing import TYPE_CHECKING
 
-from des.domain.audit_log_path_resolver import AuditLogPathResolver
+from des.domain.audit_log_path_resolver import resolve_audit_log_dir
 from des.ports.driven_ports.audit_log_writer import AuditEvent, AuditLogWriter
 
 
@@ -29,15 +31,37 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
+# O_BINARY keeps Windows from translating "\n" to "\r\n" on raw writes
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+# json.dumps() builds a new encoder per call whenever separators are given
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
 class JsonlAuditLogWriter(AuditLogWriter):
     """Writes audit events to JSONL files.
 
     Each event is serialized as one JSON line, appended to a daily log file.
     File format: audit-YYYY-MM-DD.log in the configured log directory.
+
+    Writes go straight to disk by default. With a positive buffer_limit,
+    serialized lines accumulate in memory and are appended with a single
+    write once the limit is reached, on flush()/close(), or at interpreter
+    exit. Buffered lines are lost if the process is killed before then.
+
+    The day's file is opened once with O_APPEND and kept open, so each
+    append is an fstat() and a single os.write(); the file (and its
+    directory) is recreated if it was deleted in the meantime. Call close()
+    to release it. Writes are never fsynced implicitly: they reach the OS
+    page cache immediately but may be lost on a power failure or kernel
+    crash. Callers that need that durability call sync().
     """
 
     def __init__(
-        self, log_dir: str | Path | None = None, cwd: str | Path | None = None
+        self,
+        log_dir: str | Path | None = None,
+        cwd: str | Path | None = None,
+        buffer_limit: int = 0,
     ) -> None:
         """Initialize with a log directory.
 
@@ -50,12 +74,25 @@ class JsonlAuditLogWriter(AuditLogWriter):
         Args:
             log_dir: Directory for audit log files (default: follows priority above)
             cwd: Working directory override for deterministic resolution
+            buffer_limit: Bytes to buffer before writing; 0 writes every event
         """
-        resolved = AuditLogPathResolver(log_dir=log_dir, cwd=cwd).resolve()
+        resolved = resolve_audit_log_dir(log_dir=log_dir, cwd=cwd)
 
         self._log_dir = resolved
         self._log_dir.mkdir(parents=True, exist_ok=True)
 
+        self._today = ""
+        self._today_path: Path | None = None
+
+        self._fd: int | None = None
+        self._fd_path: Path | None = None
+
+        self._buffer_limit = buffer_limit
+        self._buffer = bytearray()
+        self._buffer_file: Path | None = None
+        if buffer_limit > 0:
+            atexit.register(self.flush)
+
     def log_event(self, event: AuditEvent) -> None:
         """Append a single audit event to the log.
 
@@ -65,9 +102,6 @@ class JsonlAuditLogWriter(AuditLogWriter):
         Args:
             event: The audit event to log
         """
-        # Ensure log directory exists (handles temp dir cleanup)
-        self._log_dir.mkdir(parents=True, exist_ok=True)
-
         # Build the JSON entry from the port-defined AuditEvent
         entry = {
             "event": event.event_type,
@@ -82,21 +116,84 @@ class JsonlAuditLogWriter(AuditLogWriter):
         if event.hook_id is not None:
             entry["hook_id"] = event.hook_id
 
-        # Merge additional event-specific data
-        entry.update(event.data)
+        # Merge additional event-specific data (often empty)
+        if event.data:
+            entry.update(event.data)
 
-        # Serialize to compact JSONL
-        json_line = json.dumps(entry, separators=(",", ":"), sort_keys=True)
+        # Serialize to compact JSONL in insertion order (readers look keys up
+        # by name, so canonical ordering buys nothing), encoded once
+        json_line = _ENCODER.encode(entry)
+        json_bytes = (json_line + "\n").encode("utf-8")
 
         # Append to today's log file
         log_file = self._get_log_file()
-        with open(log_file, "a") as f:
-            f.write(json_line + "\n")
+        if self._buffer_limit <= 0:
+            self._append(log_file, json_bytes)
+            return
+
+        if self._buffer and log_file != self._buffer_file:
+            self.flush()  # UTC date rolled over; keep lines in their own day
+        self._buffer += json_bytes
+        self._buffer_file = log_file
+        if len(self._buffer) >= self._buffer_limit:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered events to the log in a single append."""
+        if not self._buffer or self._buffer_file is None:
+            return
+        self._append(self._buffer_file, self._buffer)
+        self._buffer.clear()
+
+    def sync(self) -> None:
+        """Flush buffered events and fsync the open log file to disk."""
+        self.flush()
+        if self._fd is not None:
+            os.fsync(self._fd)
+
+    def close(self) -> None:
+        """Flush buffered events and release the log file descriptor.
+
+        The writer remains usable afterwards; the next event reopens the file.
+        """
+        self.flush()
+        self._close_fd()
+
+    def __del__(self) -> None:
+        self._close_fd()
+
+    def _append(self, log_file: Path, data: bytes | bytearray) -> None:
+        """Append data to log_file through the cached O_APPEND descriptor.
+
+        The descriptor is reopened if its file has been unlinked (log dir
+        cleaned up or rotated away), so writes never land on a dead inode.
+        """
+        if self._fd is not None and os.fstat(self._fd).st_nlink == 0:
+            self._close_fd()
+        if self._fd is None or self._fd_path != log_file:
+            self._close_fd()
+            # Ensure log directory exists (handles temp dir cleanup)
+            self._log_dir.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(log_file, _OPEN_FLAGS, 0o644)
+            self._fd_path = log_file
+
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self._fd, view) :]
+
+    def _close_fd(self) -> None:
+        fd, self._fd, self._fd_path = getattr(self, "_fd", None), None, None
+        if fd is not None:
+            os.close(fd)
 
     def _get_log_file(self) -> Path:
         """Get today's log file path with date-based naming.
 
-        Format: audit-YYYY-MM-DD.log
+        Format: audit-YYYY-MM-DD.log. The path is rebuilt only when the
+        UTC date changes.
         """
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        return self._log_dir / f"audit-{today}.log"
+        today = time.strftime("%Y-%m-%d", time.gmtime())
+        if today != self._today or self._today_path is None:
+            self._today = today
+            self._today_path = self._log_dir / f"audit-{today}.log"
+        return self._today_path
@@ -4,11 +4,19 @@ Used when audit logging is disabled. Accepts all log_event calls
 without performing any I/O.
 """
 
-from des.ports.driven_ports.audit_log_writer import AuditEvent, AuditLogWriter
+from typing import Any
+
+from des.ports.driven_ports.audit_log_writer import AuditLogWriter
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Accept any arguments and do nothing."""
 
 
 class NullAuditLogWriter(AuditLogWriter):
-    """No-op implementation of AuditLogWriter for disabled audit logging."""
+    """No-op implementation of AuditLogWriter for disabled audit logging.
+
+    log_event is a shared static no-op, so calls skip method binding.
+    """
 
-    def log_event(self, event: AuditEvent) -> None:
-        """Accept event without writing. No-op."""
+    log_event = staticmethod(_noop)
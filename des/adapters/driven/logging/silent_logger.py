@@ -10,40 +10,21 @@ from typing import Any
 from des.ports.driven_ports.logging_port import LoggingPort
 
 
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Accept any arguments and do nothing."""
+
+
 class SilentLogger(LoggingPort):
     """
     Test logging adapter that performs no operations.
 
     All logging methods are no-ops, making this ideal for test environments
     where log output would clutter test results or is unnecessary.
+
+    Each port method is bound to one shared static no-op, so a call skips
+    method binding and per-method argument handling entirely.
     """
 
-    def log_validation_result(self, result: Any, context: dict[str, Any]) -> None:
-        """
-        No-op implementation of log_validation_result.
-
-        Args:
-            result: Ignored
-            context: Ignored
-        """
-        pass
-
-    def log_hook_execution(self, result: Any, step_file: str) -> None:
-        """
-        No-op implementation of log_hook_execution.
-
-        Args:
-            result: Ignored
-            step_file: Ignored
-        """
-        pass
-
-    def log_error(self, error: Exception, context: dict[str, Any]) -> None:
-        """
-        No-op implementation of log_error.
-
-        Args:
-            error: Ignored
-            context: Ignored
-        """
-        pass
+    log_validation_result = staticmethod(_noop)
+    log_hook_execution = staticmethod(_noop)
+    log_error = staticmethod(_noop)
@@ -7,12 +7,36 @@ and errors in the DES system.
 
 import json
 import sys
-from datetime import datetime
+import time
 from typing import Any, TextIO
 
 from des.ports.driven_ports.logging_port import LoggingPort
 
 
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp
+_last_second: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as a naive ISO 8601 string.
+
+    Matches the former datetime.utcnow().isoformat() output, but formats
+    the date/time part at most once per second and avoids building a
+    datetime object per log entry.
+    """
+    global _last_second
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    if _last_second[0] != seconds:
+        _last_second = (
+            seconds,
+            time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)),
+        )
+    micros = nanos // 1000
+    if not micros:
+        return _last_second[1]  # isoformat() drops a zero fraction
+    return f"{_last_second[1]}.{micros:06d}"
+
+
 class StructuredLogger(LoggingPort):
     """
     Production logging adapter that outputs structured JSON logs.
@@ -21,14 +45,17 @@ class StructuredLogger(LoggingPort):
     in JSON format for easy parsing and analysis.
     """
 
-    def __init__(self, output_stream: TextIO | None = None):
+    def __init__(self, output_stream: TextIO | None = None, autoflush: bool = False):
         """
         Initialize the structured logger.
 
         Args:
             output_stream: Stream to write logs to (default: sys.stdout)
+            autoflush: Flush the stream after every entry (default: False,
+                leaving flushing to the stream's own buffering)
         """
         self.output_stream = output_stream or sys.stdout
+        self.autoflush = autoflush
 
     def log_validation_result(self, result: Any, context: dict[str, Any]) -> None:
         """
@@ -39,7 +66,7 @@ class StructuredLogger(LoggingPort):
             context: Additional context (step_file, turn, etc.)
         """
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "event": "validation_result",
             "is_valid": getattr(result, "is_valid", None),
             "errors": getattr(result, "errors", []),
@@ -56,7 +83,7 @@ class StructuredLogger(LoggingPort):
             step_file: Path to the step file
         """
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "event": "hook_execution",
             "success": getattr(result, "success", None),
             "message": getattr(result, "message", ""),
@@ -73,7 +100,7 @@ class StructuredLogger(LoggingPort):
             context: Additional context about the error
         """
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "event": "error",
             "error_type": type(error).__name__,
             "error_message": str(error),
@@ -88,6 +115,6 @@ class StructuredLogger(LoggingPort):
         Args:
             log_entry: The log entry to write
         """
-        json_log = json.dumps(log_entry)
-        self.output_stream.write(json_log + "\n")
-        self.output_stream.flush()
+        self.output_stream.write(json.dumps(log_entry) + "\n")
+        if self.autoflush:
+            self.output_stream.flush()
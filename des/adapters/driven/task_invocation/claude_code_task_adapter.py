@@ -10,6 +10,12 @@ from typing import Any
 from des.ports.driven_ports.task_invocation_port import TaskInvocationPort
 
 
+_NOT_IMPLEMENTED_MSG = (
+    "ClaudeCodeTaskAdapter requires integration with actual Task tool. "
+    "Use MockedTaskAdapter for testing."
+)
+
+
 class ClaudeCodeTaskAdapter(TaskInvocationPort):
     """
     Production task invocation adapter that uses the actual Task tool.
@@ -41,7 +47,4 @@ class ClaudeCodeTaskAdapter(TaskInvocationPort):
             Current implementation intentionally raises NotImplementedError to prevent
             accidental use in production before integration is complete.
         """
-        raise NotImplementedError(
-            "ClaudeCodeTaskAdapter requires integration with actual Task tool. "
-            "Use MockedTaskAdapter for testing."
-        )
+        raise NotImplementedError(_NOT_IMPLEMENTED_MSG)
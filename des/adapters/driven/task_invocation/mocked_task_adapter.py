@@ -5,6 +5,7 @@ Provides a mocked task invocation adapter for testing environments,
 returning predefined results instead of invoking actual tasks.
 """
 
+from collections import deque
 from typing import Any
 
 from des.ports.driven_ports.task_invocation_port import TaskInvocationPort
@@ -31,7 +32,7 @@ class MockedTaskAdapter(TaskInvocationPort):
             results_queue: Queue of results to return in sequence
         """
         self.predefined_result = predefined_result
-        self.results_queue = results_queue or []
+        self.results_queue: deque[dict[str, Any]] = deque(results_queue or [])
         self.invocation_count = 0
 
     def invoke_task(self, prompt: str, agent: str) -> dict[str, Any]:
@@ -49,8 +50,7 @@ class MockedTaskAdapter(TaskInvocationPort):
 
         # If we have a results queue, pop from it
         if self.results_queue:
-            if len(self.results_queue) > 0:
-                return self.results_queue.pop(0)
+            return self.results_queue.popleft()
 
         # Otherwise return the predefined result
         if self.predefined_result:
@@ -5,8 +5,27 @@ This module contains adapters that interact with external systems
 for validation purposes (e.g., git subprocess for scope validation).
 """
 
-from des.adapters.driven.validation.git_scope_checker import GitScopeChecker
-from des.ports.driven_ports.scope_checker import ScopeCheckResult
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from des._lazy import lazy_exports
+
+
+if TYPE_CHECKING:
+    from des.adapters.driven.validation.git_scope_checker import GitScopeChecker
+    from des.ports.driven_ports.scope_checker import ScopeCheckResult
+
+
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "GitScopeChecker": (
+        "des.adapters.driven.validation.git_scope_checker",
+        "GitScopeChecker",
+    ),
+    "ScopeCheckResult": ("des.ports.driven_ports.scope_checker", "ScopeCheckResult"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 
 __all__ = ["GitScopeChecker", "ScopeCheckResult"]
@@ -3,15 +3,18 @@
 Implements the ScopeChecker port by using git diff to detect modified files
 and comparing them against allowed glob patterns.
 
-Infrastructure details (git subprocess, fnmatch matching) are hidden behind
+Infrastructure details (git subprocess, glob matching) are hidden behind
 the port interface. The application layer only sees ScopeCheckResult.
 """
 
 from __future__ import annotations
 
+import fnmatch
 import logging
+import os
+import re
 import subprocess
-from fnmatch import fnmatch
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from des.ports.driven_ports.scope_checker import ScopeChecker, ScopeCheckResult
@@ -24,10 +27,44 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Git reports "/"-separated paths on every OS, so only case is folded, and
+# only where the platform folds it. os.path.normcase would also rewrite "/".
+_MATCH_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+# NUL never occurs in a git path, so it stands in for "**/" while
+# fnmatch.translate handles every other wildcard
+_DOUBLESTAR_PLACEHOLDER = "\x00"
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a glob into a regex with gitignore-style ``**/``.
+
+    ``**/`` matches zero or more leading directories, so ``src/**/*``
+    covers ``src/main.py`` and ``**/*`` covers top-level files. Other
+    wildcards keep fnmatch semantics (``*`` may cross ``/``).
+    """
+    regex = fnmatch.translate(pattern.replace("**/", _DOUBLESTAR_PLACEHOLDER))
+    return regex.replace(_DOUBLESTAR_PLACEHOLDER, "(?:.*/)?")
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Fold glob patterns into one compiled alternation, None if empty.
+
+    Patterns are translated and compiled once, so each path is checked
+    against all of them with a single fullmatch() call.
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(f"(?:{_translate_glob(p)})" for p in patterns), _MATCH_FLAGS
+    )
+
+
 class GitScopeChecker(ScopeChecker):
     """Checks file modification scope using git diff.
 
-    Runs ``git diff --name-only HEAD`` in the project root directory
+    Runs ``git diff -z --name-only HEAD`` in the project root directory
     and compares modified files against allowed glob patterns.
     """
 
@@ -56,10 +93,9 @@ class GitScopeChecker(ScopeChecker):
                 skip_reason=error_reason,
             )
 
+        matcher = _compile_patterns(tuple(allowed_patterns))
         out_of_scope = [
-            f
-            for f in modified_files
-            if f.strip() and not self._matches_any_pattern(f, allowed_patterns)
+            f for f in modified_files if not self._matches_any_pattern(f, matcher)
         ]
 
         return ScopeCheckResult(
@@ -78,14 +114,17 @@ class GitScopeChecker(ScopeChecker):
         """
         try:
             result = subprocess.run(
-                ["git", "diff", "--name-only", "HEAD"],
+                ["git", "diff", "-z", "--name-only", "HEAD"],
                 capture_output=True,
                 timeout=self.GIT_TIMEOUT_SECONDS,
                 check=True,
-                text=True,
                 cwd=str(project_root),
             )
-            files = [f for f in result.stdout.strip().split("\n") if f.strip()]
+            # NUL-separated names are emitted verbatim (no quoting/escaping).
+            # Decode the raw output once; surrogateescape keeps non-UTF-8
+            # names distinct and round-trippable instead of mangling them.
+            output = result.stdout.decode("utf-8", "surrogateescape")
+            files = [name for name in output.split("\x00") if name]
             return (files, "")
 
         except subprocess.TimeoutExpired:
@@ -103,6 +142,8 @@ class GitScopeChecker(ScopeChecker):
             return (None, "Git executable not found")
 
     @staticmethod
-    def _matches_any_pattern(file_path: str, patterns: list[str]) -> bool:
+    def _matches_any_pattern(file_path: str, matcher: re.Pattern[str] | None) -> bool:
         """Check if a file path matches any of the allowed glob patterns."""
-        return any(fnmatch(file_path, pattern) for pattern in patterns)
+        if matcher is None:
+            return False
+        return matcher.fullmatch(file_path) is not None
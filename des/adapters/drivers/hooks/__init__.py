@@ -6,7 +6,25 @@ claude_code_hook_adapter -> SubagentStopService.
 MockedSubagentStopHook retained for orchestrator tests that need a HookPort stub.
 """
 
-from des.adapters.drivers.hooks.mocked_hook import MockedSubagentStopHook
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from des._lazy import lazy_exports
+
+
+if TYPE_CHECKING:
+    from des.adapters.drivers.hooks.mocked_hook import MockedSubagentStopHook
+
+
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "MockedSubagentStopHook": (
+        "des.adapters.drivers.hooks.mocked_hook",
+        "MockedSubagentStopHook",
+    ),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 
 __all__ = ["MockedSubagentStopHook"]
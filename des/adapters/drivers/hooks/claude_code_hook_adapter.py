@@ -22,14 +22,16 @@ Protocol:
   - Fail-closed: Any error causes exit 1 (BLOCK)
 """
 
-import contextlib
+from __future__ import annotations
+
+import functools
 import io
 import json
 import os
 import sys
 import time
-import uuid
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 
 # Add project root to sys.path for standalone script execution
@@ -38,40 +40,110 @@ if __name__ == "__main__":
     if project_root not in sys.path:
         sys.path.insert(0, project_root)
 
-from des.adapters.driven.git.git_commit_verifier import GitCommitVerifier
-from des.adapters.driven.hooks.yaml_execution_log_reader import (
-    YamlExecutionLogReader,
-)
-from des.adapters.driven.logging.jsonl_audit_log_writer import JsonlAuditLogWriter
 from des.adapters.driven.time.system_time import SystemTimeProvider
-from des.adapters.driven.validation.git_scope_checker import GitScopeChecker
-from des.application.pre_tool_use_service import PreToolUseService
-from des.application.subagent_stop_service import SubagentStopService
-from des.application.validator import TemplateValidator
-from des.domain.des_enforcement_policy import DesEnforcementPolicy
 from des.domain.des_marker_parser import DesMarkerParser
-from des.domain.marker_completeness_policy import MarkerCompletenessPolicy
-from des.domain.max_turns_policy import MaxTurnsPolicy
-from des.domain.session_guard_policy import SessionGuardPolicy
-from des.domain.step_completion_validator import StepCompletionValidator
-from des.domain.tdd_schema import get_tdd_schema
 from des.ports.driven_ports.audit_log_writer import AuditEvent, AuditLogWriter
-from des.ports.driver_ports.pre_tool_use_port import PreToolUseInput
 
 
+# Service dependencies are imported inside the factories and handlers that use
+# them: every hook fires a fresh process, and the protocol fast paths (empty
+# stdin, parse errors, non-DES agents) never need them.
+if TYPE_CHECKING:
+    from des.adapters.driven.config.des_config import DESConfig
+    from des.application.post_tool_use_service import PostToolUseService
+    from des.application.pre_tool_use_service import PreToolUseService
+    from des.application.subagent_stop_service import SubagentStopService
+    from des.domain.session_guard_policy import SessionGuardPolicy
+
+
+# Audit events buffered in memory before a single append to the log
+_AUDIT_BUFFER_BYTES = 64 * 1024
+
+# Responses are compact JSON; the fixed allow/empty ones are pre-encoded
+_RESPONSE_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_ALLOW_RESPONSE = b'{"decision":"allow"}\n'
+_EMPTY_RESPONSE = b"{}\n"
+
+# Stateless collaborators shared by helpers, handlers and service factories
+_TIME_PROVIDER = SystemTimeProvider()
+_MARKER_PARSER = DesMarkerParser()
+
+
+def _new_id() -> str:
+    """Return a random 128-bit correlation ID as 32 hex characters.
+
+    As unique as uuid4 (128 random bits vs 122) without importing uuid or
+    building a UUID object.
+    """
+    return os.urandom(16).hex()
+
+
+@functools.lru_cache(maxsize=1)
+def _des_config() -> DESConfig:
+    """Return the process-wide DESConfig (.nwave/des-config.json read once)."""
+    from des.adapters.driven.config.des_config import DESConfig
+
+    return DESConfig()
+
+
+@functools.lru_cache(maxsize=1)
+def _session_guard_policy() -> SessionGuardPolicy:
+    """Return the process-wide SessionGuardPolicy (stateless)."""
+    from des.domain.session_guard_policy import SessionGuardPolicy
+
+    return SessionGuardPolicy()
+
+
+@functools.lru_cache(maxsize=1)
 def _create_audit_writer() -> AuditLogWriter:
     """Create appropriate AuditLogWriter based on DES configuration.
 
     Returns JsonlAuditLogWriter by default,
     NullAuditLogWriter when explicitly disabled in .nwave/des-config.json.
+
+    The writer is created once per process and shared by the diagnostic
+    helpers and the application services. It buffers events, so a hook's
+    3-5 events reach the log in order with one append at exit instead of
+    one synchronous write each.
     """
-    from des.adapters.driven.config.des_config import DESConfig
+    from des.adapters.driven.logging.jsonl_audit_log_writer import (
+        JsonlAuditLogWriter,
+    )
     from des.adapters.driven.logging.null_audit_log_writer import NullAuditLogWriter
 
-    config = DESConfig()
-    if not config.audit_logging_enabled:
+    if not _des_config().audit_logging_enabled:
         return NullAuditLogWriter()
-    return JsonlAuditLogWriter()
+    return JsonlAuditLogWriter(buffer_limit=_AUDIT_BUFFER_BYTES)
+
+
+def _flush_audit_log() -> None:
+    """Append any buffered audit events, swallowing failures."""
+    try:
+        flush = getattr(_create_audit_writer(), "flush", None)
+        if flush is not None:
+            flush()
+    except Exception:
+        pass  # Diagnostic logging must never break the hook
+
+
+def _emit_audit_event(event_type: str, data: dict) -> None:
+    """Log one adapter diagnostic event through the shared writer.
+
+    Single write path for every diagnostic helper below. Failures are
+    swallowed: diagnostic logging must never break the hook.
+    """
+    try:
+        if not _des_config().audit_logging_enabled:
+            return  # skip the timestamp and event for the null writer
+        _create_audit_writer().log_event(
+            AuditEvent(
+                event_type=event_type,
+                timestamp=_TIME_PROVIDER.now_utc().isoformat(),
+                data=data,
+            )
+        )
+    except Exception:
+        pass  # Diagnostic logging must never break the hook
 
 
 def create_pre_tool_use_service() -> PreToolUseService:
@@ -80,12 +152,18 @@ def create_pre_tool_use_service() -> PreToolUseService:
     Returns:
         PreToolUseService configured for production use
     """
-    time_provider = SystemTimeProvider()
+    from des.application.pre_tool_use_service import PreToolUseService
+    from des.application.validator import TemplateValidator
+    from des.domain.des_enforcement_policy import DesEnforcementPolicy
+    from des.domain.marker_completeness_policy import MarkerCompletenessPolicy
+    from des.domain.max_turns_policy import MaxTurnsPolicy
+
+    time_provider = _TIME_PROVIDER
     audit_writer = _create_audit_writer()
 
     return PreToolUseService(
         max_turns_policy=MaxTurnsPolicy(),
-        marker_parser=DesMarkerParser(),
+        marker_parser=_MARKER_PARSER,
         prompt_validator=TemplateValidator(),
         audit_writer=audit_writer,
         time_provider=time_provider,
@@ -100,9 +178,17 @@ def create_subagent_stop_service() -> SubagentStopService:
     Returns:
         SubagentStopService configured for production use
     """
+    from des.adapters.driven.git.git_commit_verifier import GitCommitVerifier
+    from des.adapters.driven.hooks.yaml_execution_log_reader import (
+        YamlExecutionLogReader,
+    )
+    from des.adapters.driven.validation.git_scope_checker import GitScopeChecker
+    from des.application.subagent_stop_service import SubagentStopService
     from des.domain.log_integrity_validator import LogIntegrityValidator
+    from des.domain.step_completion_validator import StepCompletionValidator
+    from des.domain.tdd_schema import get_tdd_schema
 
-    time_provider = SystemTimeProvider()
+    time_provider = _TIME_PROVIDER
     audit_writer = _create_audit_writer()
     schema = get_tdd_schema()
 
@@ -119,6 +205,30 @@ def create_subagent_stop_service() -> SubagentStopService:
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _subagent_stop_service() -> SubagentStopService:
+    """Return the process-wide SubagentStopService.
+
+    The service and its collaborators keep no per-request state; each
+    validate() call gets everything through its SubagentStopContext.
+    """
+    return create_subagent_stop_service()
+
+
+def create_post_tool_use_service() -> PostToolUseService:
+    """Create PostToolUseService with production dependencies.
+
+    Returns:
+        PostToolUseService configured for production use
+    """
+    from des.adapters.driven.logging.jsonl_audit_log_reader import (
+        JsonlAuditLogReader,
+    )
+    from des.application.post_tool_use_service import PostToolUseService
+
+    return PostToolUseService(audit_reader=JsonlAuditLogReader())
+
+
 def _log_hook_invoked(
     handler: str, summary: dict | None = None, hook_id: str | None = None
 ) -> None:
@@ -130,38 +240,102 @@ def _log_hook_invoked(
     Args:
         handler: Name of the handler being invoked.
         summary: Optional dict of input summary fields.
-        hook_id: Optional UUID4 correlation ID. When provided, included in event data.
+        hook_id: Optional correlation ID. When provided, included in event data.
             When None, the field is omitted (backward compatible).
     """
-    try:
-        audit_writer = _create_audit_writer()
-        data: dict = {"handler": handler}
-        if hook_id is not None:
-            data["hook_id"] = hook_id
-        if summary:
-            data["input_summary"] = summary
-        audit_writer.log_event(
-            AuditEvent(
-                event_type="HOOK_INVOKED",
-                timestamp=SystemTimeProvider().now_utc().isoformat(),
-                data=data,
-            )
-        )
-    except Exception:
-        pass  # Diagnostic logging must never break the hook
+    data: dict = {"handler": handler}
+    if hook_id is not None:
+        data["hook_id"] = hook_id
+    if summary:
+        data["input_summary"] = summary
+    _emit_audit_event("HOOK_INVOKED", data)
 
 
 # Threshold in milliseconds above which a hook is considered slow
-_SLOW_HOOK_THRESHOLD_MS = 5000.0
+_SLOW_HOOK_THRESHOLD_MS = 5000
 
 # Maximum characters to capture from stderr in HOOK_ERROR events
 _STDERR_CAPTURE_MAX_CHARS = 1000
 
-_EXIT_CODE_TO_DECISION = {
-    0: "allow",
-    1: "error",
-    2: "block",
-}
+
+class _StderrCapture(io.TextIOBase):
+    """Bounded stand-in for sys.stderr while a handler runs.
+
+    Keeps only the first _STDERR_CAPTURE_MAX_CHARS written, which is all a
+    HOOK_ERROR event records, and allocates no buffer until something is
+    written, so the usual silent success path pays for none. Used directly
+    as the context manager that swaps sys.stderr, in place of a separate
+    contextlib.redirect_stderr wrapper.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[str] | None = None
+        self._remaining = _STDERR_CAPTURE_MAX_CHARS
+        self._saved_stderr = None
+
+    def __enter__(self) -> _StderrCapture:
+        self._saved_stderr, sys.stderr = sys.stderr, self
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        # Restore only; unlike IOBase.__exit__, keep the capture readable
+        sys.stderr, self._saved_stderr = self._saved_stderr, None
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        if s and self._remaining > 0:
+            if self._chunks is None:
+                self._chunks = []
+            chunk = s[: self._remaining]
+            self._chunks.append(chunk)
+            self._remaining -= len(chunk)
+        return len(s)
+
+    def getvalue(self) -> str:
+        """Return the captured text (at most _STDERR_CAPTURE_MAX_CHARS)."""
+        return "".join(self._chunks) if self._chunks else ""
+
+
+class _NoStderrCapture:
+    """No-op stand-in for _StderrCapture when audit logging is off.
+
+    Nothing would record the captured text, so stderr is left untouched.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoStderrCapture:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def getvalue(self) -> str:
+        return ""
+
+
+_NO_STDERR_CAPTURE = _NoStderrCapture()
+
+
+def _stderr_capture() -> _StderrCapture | _NoStderrCapture:
+    """Return the stderr capture for one handler run.
+
+    Only HOOK_ERROR events read the capture, so with audit logging off the
+    shared no-op is returned and sys.stderr is never swapped.
+    """
+    try:
+        if not _des_config().audit_logging_enabled:
+            return _NO_STDERR_CAPTURE
+    except Exception:
+        pass  # Fall back to capturing; the handler must still run
+    return _StderrCapture()
+
+
+# Decision name indexed by handler exit code (0, 1, 2)
+_DECISION_BY_CODE = ("allow", "error", "block")
 
 
 def _log_hook_completed(
@@ -169,7 +343,7 @@ def _log_hook_completed(
     handler: str,
     exit_code: int,
     decision: str,
-    duration_ms: float,
+    duration_ms: int,
     task_correlation_id: str | None = None,
     turns_used: int | None = None,
     tokens_used: int | None = None,
@@ -177,45 +351,35 @@ def _log_hook_completed(
     """Log a HOOK_COMPLETED diagnostic event at handler exit.
 
     Emitted in a finally block so it fires on allow, block, AND error paths.
-    Wrapped in try/except so logging never breaks the hook.
+    Logged via _emit_audit_event, so logging never breaks the hook.
 
     Args:
-        hook_id: UUID4 correlation ID matching the HOOK_INVOKED event.
+        hook_id: Correlation ID matching the HOOK_INVOKED event.
         handler: Name of the handler that completed.
         exit_code: Process exit code (0=allow, 1=error, 2=block).
         decision: Human-readable decision string.
-        duration_ms: Wall-clock duration of the handler in milliseconds.
-        task_correlation_id: Optional UUID4 linking events across the DES task lifecycle.
+        duration_ms: Wall-clock duration of the handler in whole milliseconds.
+        task_correlation_id: Optional ID linking events across the DES task lifecycle.
             When provided, included in event data. When None, the field is omitted.
         turns_used: Optional number of turns used by the subagent.
         tokens_used: Optional number of tokens used by the subagent.
     """
-    try:
-        audit_writer = _create_audit_writer()
-        data: dict = {
-            "hook_id": hook_id,
-            "handler": handler,
-            "exit_code": exit_code,
-            "decision": decision,
-            "duration_ms": duration_ms,
-        }
-        if duration_ms > _SLOW_HOOK_THRESHOLD_MS:
-            data["slow_hook"] = True
-        if task_correlation_id is not None:
-            data["task_correlation_id"] = task_correlation_id
-        if turns_used is not None:
-            data["turns_used"] = turns_used
-        if tokens_used is not None:
-            data["tokens_used"] = tokens_used
-        audit_writer.log_event(
-            AuditEvent(
-                event_type="HOOK_COMPLETED",
-                timestamp=SystemTimeProvider().now_utc().isoformat(),
-                data=data,
-            )
-        )
-    except Exception:
-        pass  # Diagnostic logging must never break the hook
+    data: dict = {
+        "hook_id": hook_id,
+        "handler": handler,
+        "exit_code": exit_code,
+        "decision": decision,
+        "duration_ms": duration_ms,
+    }
+    if duration_ms > _SLOW_HOOK_THRESHOLD_MS:
+        data["slow_hook"] = True
+    if task_correlation_id is not None:
+        data["task_correlation_id"] = task_correlation_id
+    if turns_used is not None:
+        data["turns_used"] = turns_used
+    if tokens_used is not None:
+        data["tokens_used"] = tokens_used
+    _emit_audit_event("HOOK_COMPLETED", data)
 
 
 def _log_protocol_anomaly(
@@ -228,7 +392,7 @@ def _log_protocol_anomaly(
 
     Emitted when a handler receives empty stdin or malformed JSON, which are
     protocol-level anomalies that bypass normal business logic processing.
-    Wrapped in try/except so anomaly logging never breaks the handler.
+    Logged via _emit_audit_event, so anomaly logging never breaks the handler.
 
     Args:
         handler: Name of the handler (e.g., 'pre_tool_use', 'subagent_stop').
@@ -236,22 +400,15 @@ def _log_protocol_anomaly(
         detail: Human-readable description of what happened.
         fallback_action: What the handler did ('allow' or 'error').
     """
-    try:
-        audit_writer = _create_audit_writer()
-        audit_writer.log_event(
-            AuditEvent(
-                event_type="HOOK_PROTOCOL_ANOMALY",
-                timestamp=SystemTimeProvider().now_utc().isoformat(),
-                data={
-                    "handler": handler,
-                    "anomaly_type": anomaly_type,
-                    "detail": detail,
-                    "fallback_action": fallback_action,
-                },
-            )
-        )
-    except Exception:
-        pass  # Anomaly logging must never break the handler
+    _emit_audit_event(
+        "HOOK_PROTOCOL_ANOMALY",
+        {
+            "handler": handler,
+            "anomaly_type": anomaly_type,
+            "detail": detail,
+            "fallback_action": fallback_action,
+        },
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -263,19 +420,22 @@ class _StdinParseResult:
     """Result of reading and parsing JSON from stdin.
 
     Encapsulates three outcomes: empty stdin, JSON parse error, or success.
+    The undecoded payload is kept in raw for cheap byte-level probes.
     """
 
-    __slots__ = ("hook_input", "is_empty", "parse_error")
+    __slots__ = ("hook_input", "is_empty", "parse_error", "raw")
 
     def __init__(
         self,
         hook_input: dict | None = None,
         is_empty: bool = False,
         parse_error: str | None = None,
+        raw: bytes = b"",
     ) -> None:
         self.hook_input = hook_input
         self.is_empty = is_empty
         self.parse_error = parse_error
+        self.raw = raw
 
     @property
     def ok(self) -> bool:
@@ -301,9 +461,13 @@ def _read_and_parse_stdin(
         _StdinParseResult with either parsed hook_input, is_empty flag,
         or parse_error string.
     """
-    input_data = sys.stdin.read()
+    # Read raw bytes and let json.loads decode them, skipping the text layer
+    # (falls back to the text stream when stdin has no buffer, e.g. StringIO)
+    input_data = getattr(sys.stdin, "buffer", sys.stdin).read()
+    if isinstance(input_data, str):
+        input_data = input_data.encode("utf-8", "surrogateescape")
 
-    if not input_data or not input_data.strip():
+    if not input_data or input_data.isspace():  # isspace() scans without copying
         _log_protocol_anomaly(
             handler=handler,
             anomaly_type="empty_stdin",
@@ -314,7 +478,7 @@ def _read_and_parse_stdin(
 
     try:
         hook_input = json.loads(input_data)
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # JSONDecodeError, or UnicodeDecodeError on bytes
         _log_protocol_anomaly(
             handler=handler,
             anomaly_type="json_parse_error",
@@ -323,14 +487,35 @@ def _read_and_parse_stdin(
         )
         return _StdinParseResult(parse_error=f"Invalid JSON: {e!s}")
 
-    return _StdinParseResult(hook_input=hook_input)
+    return _StdinParseResult(hook_input=hook_input, raw=input_data)
+
+
+def _write_response(response: dict) -> None:
+    """Write a protocol response to stdout as one compact JSON line."""
+    _write_response_bytes((_RESPONSE_ENCODER.encode(response) + "\n").encode("utf-8"))
+
+
+def _write_response_bytes(line: bytes) -> None:
+    """Write an encoded response line to stdout.
+
+    The line goes straight to the binary buffer, bypassing the text layer
+    (falls back to the text stream when stdout has no buffer).
+    """
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.write(line.decode("utf-8"))
+        return
+    sys.stdout.flush()  # keep any earlier text output ahead of the response
+    out.write(line)
+    out.flush()
 
 
 def _log_hook_error(handler: str, error: Exception, stderr_capture: str) -> None:
     """Log a HOOK_ERROR audit event for unhandled exceptions in handlers.
 
     Extracted from the identical try/except blocks in all 4 handler exception paths.
-    Wrapped in try/except so audit logging failure never masks the original error.
+    Logged via _emit_audit_event, so audit logging failure never masks the
+    original error.
 
     Args:
         handler: Name of the handler that raised the exception.
@@ -338,21 +523,15 @@ def _log_hook_error(handler: str, error: Exception, stderr_capture: str) -> None
         stderr_capture: Captured stderr content (already truncated by caller).
     """
     try:
-        audit_writer = _create_audit_writer()
-        audit_writer.log_event(
-            AuditEvent(
-                event_type="HOOK_ERROR",
-                timestamp=SystemTimeProvider().now_utc().isoformat(),
-                data={
-                    "error": str(error),
-                    "handler": handler,
-                    "error_type": type(error).__name__,
-                    "stderr_capture": stderr_capture,
-                },
-            )
-        )
+        data = {
+            "error": str(error),
+            "handler": handler,
+            "error_type": type(error).__name__,
+            "stderr_capture": stderr_capture,
+        }
     except Exception:
-        pass  # Don't let audit logging failure mask the original error
+        return  # Don't let audit logging failure mask the original error
+    _emit_audit_event("HOOK_ERROR", data)
 
 
 # ---------------------------------------------------------------------------
@@ -363,13 +542,56 @@ DES_SESSION_DIR = Path(".nwave") / "des"
 DES_DELIVER_SESSION_FILE = DES_SESSION_DIR / "deliver-session.json"
 DES_TASK_ACTIVE_FILE = DES_SESSION_DIR / "des-task-active"
 
+# Set once DES_SESSION_DIR has been created by this process
+_SESSION_DIR_READY = False
+
+# Path separators in project/step ids are flattened in signal file names
+_SIGNAL_NAME_TRANS = str.maketrans({"/": "_"})
+
 
 def _signal_file_for(project_id: str, step_id: str) -> Path:
     """Return the namespaced signal file path for a project/step pair."""
-    safe_name = f"{project_id}--{step_id}".replace("/", "_")
+    safe_name = f"{project_id}--{step_id}".translate(_SIGNAL_NAME_TRANS)
     return DES_SESSION_DIR / f"des-task-active-{safe_name}"
 
 
+def _signal_tmp_path(path: Path) -> Path:
+    """Per-process scratch name next to path, for atomic os.replace()."""
+    return path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+
+def _write_signal_file(path: Path, data: bytes) -> None:
+    """Write a signal file atomically with a single os.write().
+
+    The data goes to a scratch file that is renamed over path, so readers
+    see either the previous signal or the complete new one, never a
+    partial write.
+    """
+    tmp = _signal_tmp_path(path)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _link_legacy_signal(signal_file: Path, data: bytes) -> None:
+    """Hard-link the legacy singleton to signal_file instead of writing it again.
+
+    The link is made under a scratch name and renamed into place, so the
+    legacy file is never missing in between. Falls back to writing a copy
+    where hard links are unsupported.
+    """
+    tmp = _signal_tmp_path(DES_TASK_ACTIVE_FILE)
+    try:
+        os.link(signal_file, tmp)
+        os.replace(tmp, DES_TASK_ACTIVE_FILE)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        _write_signal_file(DES_TASK_ACTIVE_FILE, data)
+
+
 def _create_des_task_signal(step_id: str = "", project_id: str = "") -> str:
     """Create DES task active signal file, namespaced by project/step.
 
@@ -377,26 +599,28 @@ def _create_des_task_signal(step_id: str = "", project_id: str = "") -> str:
     Indicates a DES subagent is currently running.
 
     Returns:
-        task_correlation_id (UUID4 string) for correlating events across hooks.
+        task_correlation_id (32-char hex string) for correlating events across hooks.
         Returns empty string if signal creation fails.
     """
-    task_correlation_id = str(uuid.uuid4())
+    task_correlation_id = _new_id()
+    global _SESSION_DIR_READY
     try:
-        DES_SESSION_DIR.mkdir(parents=True, exist_ok=True)
-        from datetime import datetime, timezone
-
+        if not _SESSION_DIR_READY:
+            DES_SESSION_DIR.mkdir(parents=True, exist_ok=True)
+            _SESSION_DIR_READY = True
         signal = json.dumps(
             {
                 "step_id": step_id,
                 "project_id": project_id,
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": _TIME_PROVIDER.now_utc().isoformat(),
                 "task_correlation_id": task_correlation_id,
             }
-        )
+        ).encode("utf-8")
         signal_file = _signal_file_for(project_id, step_id)
-        signal_file.write_text(signal)
-        # Also write legacy singleton for backward compatibility
-        DES_TASK_ACTIVE_FILE.write_text(signal)
+        _write_signal_file(signal_file, signal)
+        # Also publish legacy singleton for backward compatibility
+        # (pre-write's session guard still checks it)
+        _link_legacy_signal(signal_file, signal)
     except Exception:
         pass  # Signal creation must never break the hook
     return task_correlation_id
@@ -413,12 +637,12 @@ def _read_des_task_signal(project_id: str = "", step_id: str = "") -> dict | Non
     try:
         # Try namespaced signal first (race-condition resistant)
         if project_id and step_id:
-            namespaced = _signal_file_for(project_id, step_id)
-            if namespaced.exists():
-                return json.loads(namespaced.read_text())
+            try:
+                return json.loads(_signal_file_for(project_id, step_id).read_bytes())
+            except FileNotFoundError:
+                pass
         # Fallback to legacy singleton
-        if DES_TASK_ACTIVE_FILE.exists():
-            return json.loads(DES_TASK_ACTIVE_FILE.read_text())
+        return json.loads(DES_TASK_ACTIVE_FILE.read_bytes())
     except Exception:
         pass
     return None
@@ -432,11 +656,8 @@ def _remove_des_task_signal(project_id: str = "", step_id: str = "") -> None:
     """
     try:
         if project_id and step_id:
-            namespaced = _signal_file_for(project_id, step_id)
-            if namespaced.exists():
-                namespaced.unlink()
-        if DES_TASK_ACTIVE_FILE.exists():
-            DES_TASK_ACTIVE_FILE.unlink()
+            _signal_file_for(project_id, step_id).unlink(missing_ok=True)
+        DES_TASK_ACTIVE_FILE.unlink(missing_ok=True)
     except Exception:
         pass  # Signal cleanup must never break the hook
 
@@ -456,22 +677,24 @@ def handle_pre_tool_use() -> int:
         1 if error occurs (fail-closed)
         2 if validation fails (block)
     """
-    hook_id = str(uuid.uuid4())
+    hook_id = _new_id()
     start_ns = time.perf_counter_ns()
     exit_code = 0
+    log_completed = True
     task_correlation_id: str | None = None
-    stderr_buffer = io.StringIO()
+    stderr_buffer = _stderr_capture()
     try:
-        with contextlib.redirect_stderr(stderr_buffer):
+        with stderr_buffer:
             stdin_result = _read_and_parse_stdin("pre_tool_use")
 
             if stdin_result.is_empty:
-                print(json.dumps({"decision": "allow"}))
+                log_completed = _des_config().diagnostics_verbose
+                _write_response_bytes(_ALLOW_RESPONSE)
                 return 0
 
             if stdin_result.parse_error:
                 response = {"status": "error", "reason": stdin_result.parse_error}
-                print(json.dumps(response))
+                _write_response(response)
                 exit_code = 1
                 return exit_code
 
@@ -494,6 +717,8 @@ def handle_pre_tool_use() -> int:
             max_turns = tool_input.get("max_turns")
 
             # Delegate to application service
+            from des.ports.driver_ports.pre_tool_use_port import PreToolUseInput
+
             service = create_pre_tool_use_service()
             decision = service.validate(
                 PreToolUseInput(
@@ -511,8 +736,7 @@ def handle_pre_tool_use() -> int:
                     # Extract step-id and project-id from DES markers
                     step_id_marker = ""
                     project_id_marker = ""
-                    parser = DesMarkerParser()
-                    markers = parser.parse(prompt)
+                    markers = _MARKER_PARSER.parse(prompt)
                     if markers.step_id:
                         step_id_marker = markers.step_id
                     if markers.project_id:
@@ -521,7 +745,7 @@ def handle_pre_tool_use() -> int:
                         step_id=step_id_marker, project_id=project_id_marker
                     )
                 response = {"decision": "allow"}
-                print(json.dumps(response))
+                _write_response(response)
                 exit_code = 0
                 return exit_code
             else:
@@ -535,29 +759,32 @@ def handle_pre_tool_use() -> int:
                     "decision": "block",
                     "reason": reason_with_recovery,
                 }
-                print(json.dumps(response))
+                _write_response(response)
                 exit_code = decision.exit_code
                 return exit_code
 
     except Exception as e:
         # Fail-closed: any error blocks execution
-        stderr_capture = stderr_buffer.getvalue()[:_STDERR_CAPTURE_MAX_CHARS]
+        stderr_capture = stderr_buffer.getvalue()
         _log_hook_error("pre_tool_use", e, stderr_capture)
         response = {"status": "error", "reason": f"Unexpected error: {e!s}"}
-        print(json.dumps(response))
+        _write_response(response)
         exit_code = 1
         return exit_code
     finally:
-        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
-        decision_str = _EXIT_CODE_TO_DECISION.get(exit_code, "error")
-        _log_hook_completed(
-            hook_id=hook_id,
-            handler="pre_tool_use",
-            exit_code=exit_code,
-            decision=decision_str,
-            duration_ms=duration_ms,
-            task_correlation_id=task_correlation_id,
-        )
+        if log_completed:
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            decision_str = (
+                _DECISION_BY_CODE[exit_code] if 0 <= exit_code <= 2 else "error"
+            )
+            _log_hook_completed(
+                hook_id=hook_id,
+                handler="pre_tool_use",
+                exit_code=exit_code,
+                decision=decision_str,
+                duration_ms=duration_ms,
+                task_correlation_id=task_correlation_id,
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -580,16 +807,14 @@ def _log_transcript_audit(
     event_type: str, transcript_path: str, **extra: object
 ) -> None:
     """Log a transcript-related audit event, silently swallowing failures."""
-    try:
-        _create_audit_writer().log_event(
-            AuditEvent(
-                event_type=event_type,
-                timestamp=SystemTimeProvider().now_utc().isoformat(),
-                data={"transcript_path": transcript_path, **extra},
-            )
-        )
-    except Exception:
-        pass
+    _emit_audit_event(event_type, {"transcript_path": transcript_path, **extra})
+
+
+# Read buffer for transcript scans (transcripts can be several MB)
+_TRANSCRIPT_READ_BUFFER = 128 * 1024
+
+# Raw-line pre-filter: bytes containment is a memchr-driven search
+_DES_VALIDATION_MARKER = b"DES-VALIDATION"
 
 
 def extract_des_context_from_transcript(transcript_path: str) -> dict | None:
@@ -604,18 +829,18 @@ def extract_des_context_from_transcript(transcript_path: str) -> dict | None:
     Returns:
         dict with "project_id" and "step_id" if DES markers found, None otherwise
     """
-    if not Path(transcript_path).exists():
+    if not os.path.exists(transcript_path):
         return None
 
     try:
-        with open(transcript_path) as f:
+        with open(transcript_path, "rb", buffering=_TRANSCRIPT_READ_BUFFER) as f:
             for line in f:
-                line = line.strip()
-                if not line:
+                # Only lines carrying the marker can match; skip parsing the rest
+                if _DES_VALIDATION_MARKER not in line:
                     continue
                 try:
                     entry = json.loads(line)
-                except json.JSONDecodeError:
+                except ValueError:
                     continue
 
                 message = entry.get("message", {})
@@ -626,7 +851,7 @@ def extract_des_context_from_transcript(transcript_path: str) -> dict | None:
                 if "DES-VALIDATION" not in content:
                     continue
 
-                markers = DesMarkerParser().parse(content)
+                markers = _MARKER_PARSER.parse(content)
                 if markers.is_des_task and markers.project_id and markers.step_id:
                     return {
                         "project_id": markers.project_id,
@@ -634,7 +859,7 @@ def extract_des_context_from_transcript(transcript_path: str) -> dict | None:
                     }
                 return None
 
-    except (OSError, PermissionError) as e:
+    except OSError as e:
         _log_transcript_audit("HOOK_TRANSCRIPT_ERROR", transcript_path, error=str(e))
         return None
 
@@ -706,18 +931,7 @@ def _resolve_des_context(
     return execution_log_path, project_id, step_id
 
 
-def _build_block_notification(
-    project_id: str, step_id: str, execution_log_path: str, decision
-) -> dict:
-    """Build protocol response for a blocked subagent stop decision."""
-    reason = decision.reason or "Validation failed"
-
-    recovery_suggestions = decision.recovery_suggestions or []
-    recovery_steps = "\n".join(
-        [f"  {i + 1}. {s}" for i, s in enumerate(recovery_suggestions)]
-    )
-
-    notification = f"""STOP HOOK VALIDATION FAILED
+_BLOCK_TEMPLATE = """STOP HOOK VALIDATION FAILED
 
 Step: {project_id}/{step_id}
 Execution Log: {execution_log_path}
@@ -733,6 +947,24 @@ IMPORTANT: Only the executing agent may write to execution-log.yaml.
 The orchestrator must RE-DISPATCH the agent to execute missing phases.
 Never write log entries for phases that were not actually executed."""
 
+
+def _build_block_notification(
+    project_id: str, step_id: str, execution_log_path: str, decision
+) -> dict:
+    """Build protocol response for a blocked subagent stop decision."""
+    recovery_steps = "\n".join(
+        f"  {i + 1}. {s}" for i, s in enumerate(decision.recovery_suggestions or [])
+    )
+    notification = _BLOCK_TEMPLATE.format_map(
+        {
+            "project_id": project_id,
+            "step_id": step_id,
+            "execution_log_path": execution_log_path,
+            "reason": decision.reason or "Validation failed",
+            "recovery_steps": recovery_steps,
+        }
+    )
+
     return {
         "decision": "block",
         "reason": notification,
@@ -780,24 +1012,26 @@ def handle_subagent_stop() -> int:
         1 if error occurs (fail-closed)
         2 if gate fails (BLOCKS orchestrator)
     """
-    hook_id = str(uuid.uuid4())
+    hook_id = _new_id()
     start_ns = time.perf_counter_ns()
     exit_code = 0
+    log_completed = True
     task_correlation_id: str | None = None
     turns_used: int | None = None
     tokens_used: int | None = None
-    stderr_buffer = io.StringIO()
+    stderr_buffer = _stderr_capture()
     try:
-        with contextlib.redirect_stderr(stderr_buffer):
+        with stderr_buffer:
             stdin_result = _read_and_parse_stdin("subagent_stop")
 
             if stdin_result.is_empty:
-                print(json.dumps({"decision": "allow"}))
+                log_completed = _des_config().diagnostics_verbose
+                _write_response_bytes(_ALLOW_RESPONSE)
                 return 0
 
             if stdin_result.parse_error:
                 response = {"status": "error", "reason": stdin_result.parse_error}
-                print(json.dumps(response))
+                _write_response(response)
                 exit_code = 1
                 return exit_code
 
@@ -818,7 +1052,9 @@ def handle_subagent_stop() -> int:
                 hook_id=hook_id,
             )
 
-            # Resolve DES context from either protocol
+            # Resolve DES context from either protocol. This must stay ahead of
+            # _subagent_stop_service(): non-DES agents (the common case)
+            # return here without importing or building any service dependency.
             des_context_result = _resolve_des_context(hook_input)
             if des_context_result[0] is None:
                 # Error or non-DES passthrough -- log it for diagnostics
@@ -836,7 +1072,7 @@ def handle_subagent_stop() -> int:
                     },
                     hook_id=hook_id,
                 )
-                print(json.dumps(response))
+                _write_response(response)
                 return exit_code
             execution_log_path, project_id, step_id = des_context_result
 
@@ -857,7 +1093,7 @@ def handle_subagent_stop() -> int:
             # Pass cwd for commit verification from both protocols.
             # Claude Code sends cwd in hook input JSON.
             cwd = hook_input.get("cwd", "")
-            service = create_subagent_stop_service()
+            service = _subagent_stop_service()
             decision = service.validate(
                 SubagentStopContext(
                     execution_log_path=execution_log_path,
@@ -874,38 +1110,41 @@ def handle_subagent_stop() -> int:
 
             # Translate HookDecision to protocol response
             if decision.action == "allow":
-                print(json.dumps({"decision": "allow"}))
+                _write_response_bytes(_ALLOW_RESPONSE)
                 exit_code = 0
                 return exit_code
 
             response = _build_block_notification(
                 project_id, step_id, execution_log_path, decision
             )
-            print(json.dumps(response))
+            _write_response(response)
             # Exit 0 so Claude Code processes the JSON (exit 2 ignores stdout)
             exit_code = 0
             return exit_code
 
     except Exception as e:
         # Fail-closed: any error blocks execution via stderr + exit 1
-        stderr_capture = stderr_buffer.getvalue()[:_STDERR_CAPTURE_MAX_CHARS]
+        stderr_capture = stderr_buffer.getvalue()
         _log_hook_error("subagent_stop", e, stderr_capture)
         print(f"SubagentStop hook error: {e!s}", file=sys.stderr)
         exit_code = 1
         return exit_code
     finally:
-        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
-        decision_str = _EXIT_CODE_TO_DECISION.get(exit_code, "error")
-        _log_hook_completed(
-            hook_id=hook_id,
-            handler="subagent_stop",
-            exit_code=exit_code,
-            decision=decision_str,
-            duration_ms=duration_ms,
-            task_correlation_id=task_correlation_id,
-            turns_used=turns_used,
-            tokens_used=tokens_used,
-        )
+        if log_completed:
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            decision_str = (
+                _DECISION_BY_CODE[exit_code] if 0 <= exit_code <= 2 else "error"
+            )
+            _log_hook_completed(
+                hook_id=hook_id,
+                handler="subagent_stop",
+                exit_code=exit_code,
+                decision=decision_str,
+                duration_ms=duration_ms,
+                task_correlation_id=task_correlation_id,
+                turns_used=turns_used,
+                tokens_used=tokens_used,
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -925,23 +1164,25 @@ def handle_post_tool_use() -> int:
     Returns:
         0 always (PostToolUse should never block)
     """
-    hook_id = str(uuid.uuid4())
+    hook_id = _new_id()
     start_ns = time.perf_counter_ns()
     exit_code = 0
-    stderr_buffer = io.StringIO()
+    log_completed = True
+    stderr_buffer = _stderr_capture()
     try:
-        with contextlib.redirect_stderr(stderr_buffer):
+        with stderr_buffer:
             stdin_result = _read_and_parse_stdin(
                 "post_tool_use", json_error_fallback="allow"
             )
 
             if stdin_result.is_empty:
-                print(json.dumps({}))
+                log_completed = _des_config().diagnostics_verbose
+                _write_response_bytes(_EMPTY_RESPONSE)
                 return 0
 
             if stdin_result.parse_error:
                 # PostToolUse fails open on parse errors
-                print(json.dumps({}))
+                _write_response_bytes(_EMPTY_RESPONSE)
                 return 0
 
             hook_input = stdin_result.hook_input
@@ -955,19 +1196,17 @@ def handle_post_tool_use() -> int:
                 hook_id=hook_id,
             )
 
-            # Check if the just-completed Task was a DES task (had DES markers)
-            tool_input = hook_input.get("tool_input", {})
-            prompt = tool_input.get("prompt", "")
-            is_des_task = "DES-VALIDATION" in prompt
+            # Check if the just-completed Task was a DES task (had DES markers).
+            # The byte probe on the raw payload settles the common non-DES
+            # case without touching the decoded prompt.
+            is_des_task = _DES_VALIDATION_MARKER in stdin_result.raw
+            if is_des_task:
+                tool_input = hook_input.get("tool_input", {})
+                prompt = tool_input.get("prompt", "")
+                is_des_task = "DES-VALIDATION" in prompt
 
             # Delegate to PostToolUseService
-            from des.adapters.driven.logging.jsonl_audit_log_reader import (
-                JsonlAuditLogReader,
-            )
-            from des.application.post_tool_use_service import PostToolUseService
-
-            reader = JsonlAuditLogReader()
-            service = PostToolUseService(audit_reader=reader)
+            service = create_post_tool_use_service()
             additional_context = service.check_completion_status(
                 is_des_task=is_des_task,
             )
@@ -995,25 +1234,28 @@ def handle_post_tool_use() -> int:
                 )
                 response = {}
 
-            print(json.dumps(response))
+            _write_response(response)
             return 0
 
     except Exception as e:
         # PostToolUse should never block - fail open
-        stderr_capture = stderr_buffer.getvalue()[:_STDERR_CAPTURE_MAX_CHARS]
+        stderr_capture = stderr_buffer.getvalue()
         _log_hook_error("post_tool_use", e, stderr_capture)
-        print(json.dumps({}))
+        _write_response_bytes(_EMPTY_RESPONSE)
         return 0
     finally:
-        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
-        decision_str = _EXIT_CODE_TO_DECISION.get(exit_code, "error")
-        _log_hook_completed(
-            hook_id=hook_id,
-            handler="post_tool_use",
-            exit_code=exit_code,
-            decision=decision_str,
-            duration_ms=duration_ms,
-        )
+        if log_completed:
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            decision_str = (
+                _DECISION_BY_CODE[exit_code] if 0 <= exit_code <= 2 else "error"
+            )
+            _log_hook_completed(
+                hook_id=hook_id,
+                handler="post_tool_use",
+                exit_code=exit_code,
+                decision=decision_str,
+                duration_ms=duration_ms,
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -1030,29 +1272,22 @@ def _log_pre_write_decision(
     """Log a HOOK_PRE_WRITE_ALLOWED or HOOK_PRE_WRITE_BLOCKED diagnostic event.
 
     Emitted after SessionGuardPolicy check to record the decision with context.
-    Wrapped in try/except so logging never breaks the hook.
+    Logged via _emit_audit_event, so logging never breaks the hook.
 
     Args:
-        hook_id: UUID4 correlation ID matching the HOOK_INVOKED event.
+        hook_id: Correlation ID matching the HOOK_INVOKED event.
         event_type: Either HOOK_PRE_WRITE_ALLOWED or HOOK_PRE_WRITE_BLOCKED.
         file_path: Path of the file being written.
         reason: Why the write was allowed or blocked.
     """
-    try:
-        audit_writer = _create_audit_writer()
-        audit_writer.log_event(
-            AuditEvent(
-                event_type=event_type,
-                timestamp=SystemTimeProvider().now_utc().isoformat(),
-                data={
-                    "hook_id": hook_id,
-                    "file_path": file_path,
-                    "reason": reason,
-                },
-            )
-        )
-    except Exception:
-        pass  # Diagnostic logging must never break the hook
+    _emit_audit_event(
+        event_type,
+        {
+            "hook_id": hook_id,
+            "file_path": file_path,
+            "reason": reason,
+        },
+    )
 
 
 def _log_post_tool_use_decision(
@@ -1064,31 +1299,21 @@ def _log_post_tool_use_decision(
     """Log a HOOK_POST_TOOL_USE_INJECTED or HOOK_POST_TOOL_USE_PASSTHROUGH event.
 
     Emitted after PostToolUseService.check_completion_status() to record
-    whether context was injected or not. Wrapped in try/except so logging
-    never breaks the hook.
+    whether context was injected or not. Logged via _emit_audit_event, so
+    logging never breaks the hook.
 
     Args:
-        hook_id: UUID4 correlation ID matching the HOOK_INVOKED event.
+        hook_id: Correlation ID matching the HOOK_INVOKED event.
         event_type: Either HOOK_POST_TOOL_USE_INJECTED or HOOK_POST_TOOL_USE_PASSTHROUGH.
         is_des_task: Whether the just-completed Task had DES markers.
         **extra: Additional key-value pairs (context_type, reason, etc.).
     """
-    try:
-        audit_writer = _create_audit_writer()
-        data: dict = {
-            "hook_id": hook_id,
-            "is_des_task": is_des_task,
-        }
-        data.update(extra)
-        audit_writer.log_event(
-            AuditEvent(
-                event_type=event_type,
-                timestamp=SystemTimeProvider().now_utc().isoformat(),
-                data=data,
-            )
-        )
-    except Exception:
-        pass  # Decision logging must never break the hook
+    data: dict = {
+        "hook_id": hook_id,
+        "is_des_task": is_des_task,
+    }
+    data.update(extra)
+    _emit_audit_event(event_type, data)
 
 
 # ---------------------------------------------------------------------------
@@ -1106,23 +1331,25 @@ def handle_pre_write() -> int:
         0 if write is allowed
         2 if write is blocked (source file during deliver without DES task)
     """
-    hook_id = str(uuid.uuid4())
+    hook_id = _new_id()
     start_ns = time.perf_counter_ns()
     exit_code = 0
-    stderr_buffer = io.StringIO()
+    log_completed = True
+    stderr_buffer = _stderr_capture()
     try:
-        with contextlib.redirect_stderr(stderr_buffer):
+        with stderr_buffer:
             stdin_result = _read_and_parse_stdin(
                 "pre_write", json_error_fallback="allow"
             )
 
             if stdin_result.is_empty:
-                print(json.dumps({"decision": "allow"}))
+                log_completed = _des_config().diagnostics_verbose
+                _write_response_bytes(_ALLOW_RESPONSE)
                 return 0
 
             if stdin_result.parse_error:
                 # Write/Edit fails open on parse errors
-                print(json.dumps({"decision": "allow"}))
+                _write_response_bytes(_ALLOW_RESPONSE)
                 return 0
 
             hook_input = stdin_result.hook_input
@@ -1131,9 +1358,10 @@ def handle_pre_write() -> int:
             tool_input = hook_input.get("tool_input", {})
             file_path = tool_input.get("file_path", "")
 
-            # Check session and signal state
-            session_active = DES_DELIVER_SESSION_FILE.exists()
-            des_task_active = DES_TASK_ACTIVE_FILE.exists()
+            # Check session and signal state (os.path.exists is a bare stat
+            # without Path overhead)
+            session_active = os.path.exists(DES_DELIVER_SESSION_FILE)
+            des_task_active = os.path.exists(DES_TASK_ACTIVE_FILE)
 
             # Diagnostic: confirm hook was invoked with full context
             _log_hook_invoked(
@@ -1146,8 +1374,7 @@ def handle_pre_write() -> int:
                 hook_id=hook_id,
             )
 
-            policy = SessionGuardPolicy()
-            guard_result = policy.check(
+            guard_result = _session_guard_policy().check(
                 file_path=file_path,
                 session_active=session_active,
                 des_task_active=des_task_active,
@@ -1165,7 +1392,7 @@ def handle_pre_write() -> int:
                     "reason": guard_result.reason
                     or "Source write blocked during deliver",
                 }
-                print(json.dumps(response))
+                _write_response(response)
                 exit_code = 2
                 return exit_code
             else:
@@ -1177,27 +1404,30 @@ def handle_pre_write() -> int:
                     file_path=file_path,
                     reason=allow_reason,
                 )
-                print(json.dumps({"decision": "allow"}))
+                _write_response_bytes(_ALLOW_RESPONSE)
                 exit_code = 0
                 return exit_code
 
     except Exception as e:
         # Fail-open for Write/Edit (unlike Task which is fail-closed)
-        stderr_capture = stderr_buffer.getvalue()[:_STDERR_CAPTURE_MAX_CHARS]
+        stderr_capture = stderr_buffer.getvalue()
         _log_hook_error("pre_write", e, stderr_capture)
-        print(json.dumps({"decision": "allow"}))
+        _write_response_bytes(_ALLOW_RESPONSE)
         exit_code = 0
         return exit_code
     finally:
-        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
-        decision_str = _EXIT_CODE_TO_DECISION.get(exit_code, "error")
-        _log_hook_completed(
-            hook_id=hook_id,
-            handler="pre_write",
-            exit_code=exit_code,
-            decision=decision_str,
-            duration_ms=duration_ms,
-        )
+        if log_completed:
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+            decision_str = (
+                _DECISION_BY_CODE[exit_code] if 0 <= exit_code <= 2 else "error"
+            )
+            _log_hook_completed(
+                hook_id=hook_id,
+                handler="pre_write",
+                exit_code=exit_code,
+                decision=decision_str,
+                duration_ms=duration_ms,
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -1205,34 +1435,39 @@ def handle_pre_write() -> int:
 # ---------------------------------------------------------------------------
 
 
+_HANDLERS = {
+    "pre-tool-use": handle_pre_tool_use,
+    "pre-task": handle_pre_tool_use,  # backward compatibility
+    "subagent-stop": handle_subagent_stop,
+    "post-tool-use": handle_post_tool_use,
+    "pre-write": handle_pre_write,
+    "pre-edit": handle_pre_write,
+}
+
+
 def main() -> None:
     """Hook adapter entry point - routes command to appropriate handler."""
     if len(sys.argv) < 2:
-        print(
-            json.dumps(
-                {
-                    "status": "error",
-                    "reason": "Missing command argument (pre-tool-use or subagent-stop)",
-                }
-            )
+        _write_response(
+            {
+                "status": "error",
+                "reason": "Missing command argument (pre-tool-use or subagent-stop)",
+            }
         )
         sys.exit(1)
 
     command = sys.argv[1]
-
-    if command in ("pre-tool-use", "pre-task"):
-        # "pre-task" accepted for backward compatibility
-        exit_code = handle_pre_tool_use()
-    elif command == "subagent-stop":
-        exit_code = handle_subagent_stop()
-    elif command == "post-tool-use":
-        exit_code = handle_post_tool_use()
-    elif command in ("pre-write", "pre-edit"):
-        exit_code = handle_pre_write()
+    handler = _HANDLERS.get(command)
+    if handler is not None:
+        exit_code = handler()
     else:
-        print(json.dumps({"status": "error", "reason": f"Unknown command: {command}"}))
+        _write_response({"status": "error", "reason": f"Unknown command: {command}"})
         exit_code = 1
 
+    # The handler has already written its response and measured duration_ms;
+    # buffered audit events are appended once here, off that measured path.
+    # A drain thread would not help: the host still waits for process exit.
+    _flush_audit_log()
     sys.exit(exit_code)
 
 
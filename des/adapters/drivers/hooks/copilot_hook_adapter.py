@@ -35,13 +35,16 @@ Notes:
   - additionalContext for PostToolUse is supported in Copilot (same field name).
 """
 
-import contextlib
+from __future__ import annotations
+
+import functools
 import io
 import json
+import os
 import sys
 import time
-import uuid
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 
 # Ensure DES package is importable when running as __main__
@@ -52,56 +55,101 @@ if __name__ == "__main__":
     if src_root not in sys.path:
         sys.path.insert(0, src_root)
 
-from des.adapters.driven.git.git_commit_verifier import GitCommitVerifier
-from des.adapters.driven.hooks.yaml_execution_log_reader import YamlExecutionLogReader
-from des.adapters.driven.logging.jsonl_audit_log_writer import JsonlAuditLogWriter
 from des.adapters.driven.time.system_time import SystemTimeProvider
-from des.adapters.driven.validation.git_scope_checker import GitScopeChecker
-from des.application.pre_tool_use_service import PreToolUseService
-from des.application.subagent_stop_service import SubagentStopService
-from des.application.validator import TemplateValidator
-from des.domain.des_enforcement_policy import DesEnforcementPolicy
 from des.domain.des_marker_parser import DesMarkerParser
-from des.domain.log_integrity_validator import LogIntegrityValidator
-from des.domain.marker_completeness_policy import MarkerCompletenessPolicy
-from des.domain.max_turns_policy import MaxTurnsPolicy
-from des.domain.session_guard_policy import SessionGuardPolicy
-from des.domain.step_completion_validator import StepCompletionValidator
-from des.domain.tdd_schema import get_tdd_schema
 from des.ports.driven_ports.audit_log_writer import AuditEvent, AuditLogWriter
-from des.ports.driver_ports.pre_tool_use_port import PreToolUseInput
+
+
+# Service dependencies are imported where used so the protocol fast paths
+# (empty stdin, non-DES agents) skip them on every fresh hook process.
+if TYPE_CHECKING:
+    from des.adapters.driven.config.des_config import DESConfig
+    from des.application.post_tool_use_service import PostToolUseService
+    from des.application.pre_tool_use_service import PreToolUseService
+    from des.application.subagent_stop_service import SubagentStopService
 
 
 # ---------------------------------------------------------------------------
 # Shared infrastructure (mirrors claude_code_hook_adapter.py structure)
 # ---------------------------------------------------------------------------
 
-_SLOW_HOOK_THRESHOLD_MS = 5000.0
+_SLOW_HOOK_THRESHOLD_MS = 5000
 _STDERR_CAPTURE_MAX_CHARS = 1000
 
+# Audit events buffered in memory before a single append to the log
+_AUDIT_BUFFER_BYTES = 64 * 1024
+
 # Signal files written by preToolUse so subagentStop can recover DES context.
 # Copilot's subagentStop does not provide the task prompt, so we use files.
 DES_SESSION_DIR = Path(".nwave") / "des"
 DES_TASK_ACTIVE_FILE = DES_SESSION_DIR / "des-task-active"
 
+# Set once DES_SESSION_DIR has been created by this process
+_SESSION_DIR_READY = False
 
-def _create_audit_writer() -> AuditLogWriter:
+# Path separators in project/step ids are flattened in signal file names
+_SIGNAL_NAME_TRANS = str.maketrans({"/": "_"})
+
+# Fixed responses, pre-encoded as compact JSON lines
+_APPROVE_RESPONSE = b'{"permissionDecision":"approve"}\n'
+_EMPTY_RESPONSE = b"{}\n"
+
+# Byte probe for DES-marked prompts in the raw stdin payload
+_DES_VALIDATION_MARKER = b"DES-VALIDATION"
+
+# Compact JSON for signal files and responses
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Stateless collaborators shared by helpers, handlers and service factories
+_TIME_PROVIDER = SystemTimeProvider()
+_MARKER_PARSER = DesMarkerParser()
+
+
+def _new_id() -> str:
+    """Return a random 128-bit correlation ID as 32 hex characters."""
+    return os.urandom(16).hex()
+
+
+@functools.lru_cache(maxsize=1)
+def _des_config() -> DESConfig:
+    """Return the process-wide DESConfig (.nwave/des-config.json read once)."""
     from des.adapters.driven.config.des_config import DESConfig
+
+    return DESConfig()
+
+
+@functools.lru_cache(maxsize=1)
+def _create_audit_writer() -> AuditLogWriter:
+    """Return the process-wide AuditLogWriter."""
+    from des.adapters.driven.logging.jsonl_audit_log_writer import (
+        JsonlAuditLogWriter,
+    )
     from des.adapters.driven.logging.null_audit_log_writer import NullAuditLogWriter
 
-    config = DESConfig()
-    if not config.audit_logging_enabled:
+    if not _des_config().audit_logging_enabled:
         return NullAuditLogWriter()
-    return JsonlAuditLogWriter()
+    return JsonlAuditLogWriter(buffer_limit=_AUDIT_BUFFER_BYTES)
+
+
+def _flush_audit_log() -> None:
+    """Append any buffered audit events, swallowing failures."""
+    try:
+        flush = getattr(_create_audit_writer(), "flush", None)
+        if flush is not None:
+            flush()
+    except Exception:
+        pass  # Diagnostic logging must never break the hook
 
 
 def _log_event(event_type: str, data: dict) -> None:
     """Log an audit event, swallowing failures."""
     try:
+        if not _des_config().audit_logging_enabled:
+            return  # skip the timestamp and event for the null writer
         _create_audit_writer().log_event(
             AuditEvent(
                 event_type=event_type,
-                timestamp=SystemTimeProvider().now_utc().isoformat(),
+                timestamp=_TIME_PROVIDER.now_utc().isoformat(),
                 data=data,
             )
         )
@@ -109,24 +157,103 @@ def _log_event(event_type: str, data: dict) -> None:
         pass
 
 
-def _read_and_parse_stdin(handler: str) -> tuple[dict | None, bool]:
+class _StderrCapture(io.TextIOBase):
+    """Bounded stand-in for sys.stderr while a handler runs.
+
+    Keeps only the first _STDERR_CAPTURE_MAX_CHARS written, which is all a
+    HOOK_ERROR event records, and allocates no buffer until something is
+    written, so the usual silent success path pays for none. Used directly
+    as the context manager that swaps sys.stderr, in place of a separate
+    contextlib.redirect_stderr wrapper.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[str] | None = None
+        self._remaining = _STDERR_CAPTURE_MAX_CHARS
+        self._saved_stderr = None
+
+    def __enter__(self) -> _StderrCapture:
+        self._saved_stderr, sys.stderr = sys.stderr, self
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        # Restore only; unlike IOBase.__exit__, keep the capture readable
+        sys.stderr, self._saved_stderr = self._saved_stderr, None
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        if s and self._remaining > 0:
+            if self._chunks is None:
+                self._chunks = []
+            chunk = s[: self._remaining]
+            self._chunks.append(chunk)
+            self._remaining -= len(chunk)
+        return len(s)
+
+    def getvalue(self) -> str:
+        """Return the captured text (at most _STDERR_CAPTURE_MAX_CHARS)."""
+        return "".join(self._chunks) if self._chunks else ""
+
+
+class _NoStderrCapture:
+    """No-op stand-in for _StderrCapture when audit logging is off.
+
+    Nothing would record the captured text, so stderr is left untouched.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoStderrCapture:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def getvalue(self) -> str:
+        return ""
+
+
+_NO_STDERR_CAPTURE = _NoStderrCapture()
+
+
+def _stderr_capture() -> _StderrCapture | _NoStderrCapture:
+    """Return the stderr capture for one handler run.
+
+    Only HOOK_ERROR events read the capture, so with audit logging off the
+    shared no-op is returned and sys.stderr is never swapped.
+    """
+    try:
+        if not _des_config().audit_logging_enabled:
+            return _NO_STDERR_CAPTURE
+    except Exception:
+        pass  # Fall back to capturing; the handler must still run
+    return _StderrCapture()
+
+
+def _read_and_parse_stdin(handler: str) -> tuple[dict | None, bool, bytes]:
     """Read JSON from stdin.
 
     Returns:
-        (hook_input, is_empty)
-        hook_input is None on parse error or empty stdin.
+        (hook_input, is_empty, raw)
+        hook_input is None on parse error or empty stdin; raw is the
+        undecoded payload, kept for cheap byte-level probes.
     """
-    raw = sys.stdin.read()
-    if not raw or not raw.strip():
+    raw = getattr(sys.stdin, "buffer", sys.stdin).read()
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8", "surrogateescape")
+    if not raw or raw.isspace():  # isspace() scans without copying
         _log_event(
             "HOOK_PROTOCOL_ANOMALY",
             {"handler": handler, "anomaly_type": "empty_stdin", "fallback": "allow"},
         )
-        return None, True
+        return None, True, raw
 
     try:
-        return json.loads(raw), False
-    except json.JSONDecodeError as e:
+        return json.loads(raw), False, raw
+    except ValueError as e:  # JSONDecodeError, or UnicodeDecodeError on bytes
         _log_event(
             "HOOK_PROTOCOL_ANOMALY",
             {
@@ -136,31 +263,90 @@ def _read_and_parse_stdin(handler: str) -> tuple[dict | None, bool]:
                 "fallback": "allow",
             },
         )
-        return None, False
+        return None, False, raw
+
+
+def _write_response(response: dict) -> None:
+    """Write a protocol response to stdout as one compact JSON line."""
+    _write_response_bytes((_JSON_ENCODER.encode(response) + "\n").encode("utf-8"))
+
+
+def _write_response_bytes(line: bytes) -> None:
+    """Write an encoded response line to stdout.
+
+    The line goes straight to the binary buffer, bypassing the text layer
+    (falls back to the text stream when stdout has no buffer).
+    """
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        sys.stdout.write(line.decode("utf-8"))
+        return
+    sys.stdout.flush()  # keep any earlier text output ahead of the response
+    out.write(line)
+    out.flush()
 
 
 def _signal_file_for(project_id: str, step_id: str) -> Path:
-    safe_name = f"{project_id}--{step_id}".replace("/", "_")
+    safe_name = f"{project_id}--{step_id}".translate(_SIGNAL_NAME_TRANS)
     return DES_SESSION_DIR / f"des-task-active-{safe_name}"
 
 
+def _signal_tmp_path(path: Path) -> Path:
+    """Per-process scratch name next to path, for atomic os.replace()."""
+    return path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+
+def _write_signal_file(path: Path, data: bytes) -> None:
+    """Write a signal file atomically with a single os.write().
+
+    The data goes to a scratch file that is renamed over path, so readers
+    see either the previous signal or the complete new one, never a
+    partial write.
+    """
+    tmp = _signal_tmp_path(path)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _link_legacy_signal(signal_file: Path, data: bytes) -> None:
+    """Hard-link the legacy singleton to signal_file instead of writing it again.
+
+    The link is made under a scratch name and renamed into place, so the
+    legacy file is never missing in between. Falls back to writing a copy
+    where hard links are unsupported.
+    """
+    tmp = _signal_tmp_path(DES_TASK_ACTIVE_FILE)
+    try:
+        os.link(signal_file, tmp)
+        os.replace(tmp, DES_TASK_ACTIVE_FILE)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        _write_signal_file(DES_TASK_ACTIVE_FILE, data)
+
+
 def _create_des_task_signal(step_id: str, project_id: str) -> str:
     """Create signal file so subagentStop can recover DES context without transcript."""
-    task_correlation_id = str(uuid.uuid4())
+    global _SESSION_DIR_READY
+    task_correlation_id = _new_id()
     try:
-        from datetime import datetime, timezone
-
-        DES_SESSION_DIR.mkdir(parents=True, exist_ok=True)
-        signal = json.dumps(
+        if not _SESSION_DIR_READY:
+            DES_SESSION_DIR.mkdir(parents=True, exist_ok=True)
+            _SESSION_DIR_READY = True
+        signal = _JSON_ENCODER.encode(
             {
                 "step_id": step_id,
                 "project_id": project_id,
-                "created_at": datetime.now(timezone.utc).isoformat(),
+                "created_at": _TIME_PROVIDER.now_utc().isoformat(),
                 "task_correlation_id": task_correlation_id,
             }
-        )
-        _signal_file_for(project_id, step_id).write_text(signal)
-        DES_TASK_ACTIVE_FILE.write_text(signal)  # legacy fallback
+        ).encode("utf-8")
+        signal_file = _signal_file_for(project_id, step_id)
+        _write_signal_file(signal_file, signal)
+        _link_legacy_signal(signal_file, signal)  # legacy fallback
     except Exception:
         pass
     return task_correlation_id
@@ -169,11 +355,11 @@ def _create_des_task_signal(step_id: str, project_id: str) -> str:
 def _read_des_task_signal(project_id: str = "", step_id: str = "") -> dict | None:
     try:
         if project_id and step_id:
-            namespaced = _signal_file_for(project_id, step_id)
-            if namespaced.exists():
-                return json.loads(namespaced.read_text())
-        if DES_TASK_ACTIVE_FILE.exists():
-            return json.loads(DES_TASK_ACTIVE_FILE.read_text())
+            try:
+                return json.loads(_signal_file_for(project_id, step_id).read_bytes())
+            except FileNotFoundError:
+                pass
+        return json.loads(DES_TASK_ACTIVE_FILE.read_bytes())
     except Exception:
         pass
     return None
@@ -182,11 +368,8 @@ def _read_des_task_signal(project_id: str = "", step_id: str = "") -> dict | Non
 def _remove_des_task_signal(project_id: str = "", step_id: str = "") -> None:
     try:
         if project_id and step_id:
-            namespaced = _signal_file_for(project_id, step_id)
-            if namespaced.exists():
-                namespaced.unlink()
-        if DES_TASK_ACTIVE_FILE.exists():
-            DES_TASK_ACTIVE_FILE.unlink()
+            _signal_file_for(project_id, step_id).unlink(missing_ok=True)
+        DES_TASK_ACTIVE_FILE.unlink(missing_ok=True)
     except Exception:
         pass
 
@@ -197,11 +380,17 @@ def _remove_des_task_signal(project_id: str = "", step_id: str = "") -> None:
 
 
 def create_pre_tool_use_service() -> PreToolUseService:
-    time_provider = SystemTimeProvider()
+    from des.application.pre_tool_use_service import PreToolUseService
+    from des.application.validator import TemplateValidator
+    from des.domain.des_enforcement_policy import DesEnforcementPolicy
+    from des.domain.marker_completeness_policy import MarkerCompletenessPolicy
+    from des.domain.max_turns_policy import MaxTurnsPolicy
+
+    time_provider = _TIME_PROVIDER
     audit_writer = _create_audit_writer()
     return PreToolUseService(
         max_turns_policy=MaxTurnsPolicy(),
-        marker_parser=DesMarkerParser(),
+        marker_parser=_MARKER_PARSER,
         prompt_validator=TemplateValidator(),
         audit_writer=audit_writer,
         time_provider=time_provider,
@@ -211,7 +400,17 @@ def create_pre_tool_use_service() -> PreToolUseService:
 
 
 def create_subagent_stop_service() -> SubagentStopService:
-    time_provider = SystemTimeProvider()
+    from des.adapters.driven.git.git_commit_verifier import GitCommitVerifier
+    from des.adapters.driven.hooks.yaml_execution_log_reader import (
+        YamlExecutionLogReader,
+    )
+    from des.adapters.driven.validation.git_scope_checker import GitScopeChecker
+    from des.application.subagent_stop_service import SubagentStopService
+    from des.domain.log_integrity_validator import LogIntegrityValidator
+    from des.domain.step_completion_validator import StepCompletionValidator
+    from des.domain.tdd_schema import get_tdd_schema
+
+    time_provider = _TIME_PROVIDER
     audit_writer = _create_audit_writer()
     schema = get_tdd_schema()
     return SubagentStopService(
@@ -227,6 +426,21 @@ def create_subagent_stop_service() -> SubagentStopService:
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _subagent_stop_service() -> SubagentStopService:
+    """Return the process-wide SubagentStopService (no per-request state)."""
+    return create_subagent_stop_service()
+
+
+def create_post_tool_use_service() -> PostToolUseService:
+    from des.adapters.driven.logging.jsonl_audit_log_reader import (
+        JsonlAuditLogReader,
+    )
+    from des.application.post_tool_use_service import PostToolUseService
+
+    return PostToolUseService(audit_reader=JsonlAuditLogReader())
+
+
 # ---------------------------------------------------------------------------
 # Handler: PreToolUse
 # ---------------------------------------------------------------------------
@@ -243,18 +457,18 @@ def handle_pre_tool_use() -> int:
     Copilot preToolUse output (approve):
       {"permissionDecision": "approve"}
     """
-    hook_id = str(uuid.uuid4())
+    hook_id = _new_id()
     start_ns = time.perf_counter_ns()
     task_correlation_id: str | None = None
-    stderr_buffer = io.StringIO()
+    stderr_buffer = _stderr_capture()
     exit_code = 0
 
     try:
-        with contextlib.redirect_stderr(stderr_buffer):
-            hook_input, is_empty = _read_and_parse_stdin("pre_tool_use")
+        with stderr_buffer:
+            hook_input, is_empty, _raw = _read_and_parse_stdin("pre_tool_use")
 
             if is_empty or hook_input is None:
-                print(json.dumps({"permissionDecision": "approve"}))
+                _write_response_bytes(_APPROVE_RESPONSE)
                 return 0
 
             # Copilot protocol: toolArgs instead of tool_input
@@ -272,6 +486,8 @@ def handle_pre_tool_use() -> int:
                 },
             )
 
+            from des.ports.driver_ports.pre_tool_use_port import PreToolUseInput
+
             service = create_pre_tool_use_service()
             decision = service.validate(
                 PreToolUseInput(
@@ -284,13 +500,12 @@ def handle_pre_tool_use() -> int:
 
             if decision.action == "allow":
                 if "DES-VALIDATION" in prompt:
-                    parser = DesMarkerParser()
-                    markers = parser.parse(prompt)
+                    markers = _MARKER_PARSER.parse(prompt)
                     task_correlation_id = _create_des_task_signal(
                         step_id=markers.step_id or "",
                         project_id=markers.project_id or "",
                     )
-                print(json.dumps({"permissionDecision": "approve"}))
+                _write_response_bytes(_APPROVE_RESPONSE)
                 return 0
             else:
                 reason = decision.reason or "Validation failed"
@@ -299,27 +514,25 @@ def handle_pre_tool_use() -> int:
                     reason += "\n\nRecovery:\n" + "\n".join(
                         f"  {i + 1}. {s}" for i, s in enumerate(recovery)
                     )
-                print(
-                    json.dumps(
-                        {
-                            "permissionDecision": "deny",
-                            "permissionDecisionReason": reason,
-                        }
-                    )
+                _write_response(
+                    {
+                        "permissionDecision": "deny",
+                        "permissionDecisionReason": reason,
+                    }
                 )
                 return 0  # Copilot reads deny from JSON; always exit 0
 
     except Exception as e:
-        stderr_capture = stderr_buffer.getvalue()[:_STDERR_CAPTURE_MAX_CHARS]
+        stderr_capture = stderr_buffer.getvalue()
         _log_event(
             "HOOK_ERROR",
             {"handler": "pre_tool_use", "error": str(e), "stderr": stderr_capture},
         )
         # Fail-open for errors: deny would block all agent use if adapter crashes
-        print(json.dumps({"permissionDecision": "approve"}))
+        _write_response_bytes(_APPROVE_RESPONSE)
         return 0
     finally:
-        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         _log_event(
             "HOOK_COMPLETED",
             {
@@ -349,17 +562,17 @@ def handle_subagent_stop() -> int:
 
     Non-DES agents (no signal file) are allowed through silently.
     """
-    hook_id = str(uuid.uuid4())
+    hook_id = _new_id()
     start_ns = time.perf_counter_ns()
     exit_code = 0
-    stderr_buffer = io.StringIO()
+    stderr_buffer = _stderr_capture()
 
     try:
-        with contextlib.redirect_stderr(stderr_buffer):
-            hook_input, is_empty = _read_and_parse_stdin("subagent_stop")
+        with stderr_buffer:
+            hook_input, is_empty, _raw = _read_and_parse_stdin("subagent_stop")
 
             if is_empty or hook_input is None:
-                print(json.dumps({"permissionDecision": "approve"}))
+                _write_response_bytes(_APPROVE_RESPONSE)
                 return 0
 
             _log_event(
@@ -376,7 +589,7 @@ def handle_subagent_stop() -> int:
             signal_data = _read_des_task_signal()
             if signal_data is None:
                 # No signal file: non-DES agent, allow through
-                print(json.dumps({"permissionDecision": "approve"}))
+                _write_response_bytes(_APPROVE_RESPONSE)
                 return 0
 
             project_id = signal_data.get("project_id", "")
@@ -387,12 +600,10 @@ def handle_subagent_stop() -> int:
             if not project_id or not step_id:
                 # Malformed signal: allow through and clean up
                 _remove_des_task_signal()
-                print(json.dumps({"permissionDecision": "approve"}))
+                _write_response_bytes(_APPROVE_RESPONSE)
                 return 0
 
             # cwd: Copilot may or may not include this; fall back to os.getcwd()
-            import os
-
             cwd = hook_input.get("cwd", "") or os.getcwd()
             execution_log_path = str(
                 Path(cwd) / "docs" / "feature" / project_id / "execution-log.yaml"
@@ -404,7 +615,7 @@ def handle_subagent_stop() -> int:
             from des.ports.driver_ports.subagent_stop_port import SubagentStopContext
 
             stop_hook_active = bool(hook_input.get("stopHookActive", False))
-            service = create_subagent_stop_service()
+            service = _subagent_stop_service()
             decision = service.validate(
                 SubagentStopContext(
                     execution_log_path=execution_log_path,
@@ -418,7 +629,7 @@ def handle_subagent_stop() -> int:
             )
 
             if decision.action == "allow":
-                print(json.dumps({"permissionDecision": "approve"}))
+                _write_response_bytes(_APPROVE_RESPONSE)
                 return 0
 
             # Build block notification
@@ -435,27 +646,25 @@ def handle_subagent_stop() -> int:
                 f"RECOVERY REQUIRED:\n{recovery_steps}\n\n"
                 f"Re-dispatch the agent to complete the missing TDD phases."
             )
-            print(
-                json.dumps(
-                    {
-                        "permissionDecision": "deny",
-                        "permissionDecisionReason": notification,
-                    }
-                )
+            _write_response(
+                {
+                    "permissionDecision": "deny",
+                    "permissionDecisionReason": notification,
+                }
             )
             return 0
 
     except Exception as e:
-        stderr_capture = stderr_buffer.getvalue()[:_STDERR_CAPTURE_MAX_CHARS]
+        stderr_capture = stderr_buffer.getvalue()
         _log_event(
             "HOOK_ERROR",
             {"handler": "subagent_stop", "error": str(e), "stderr": stderr_capture},
         )
         # Fail-open: do not block on adapter errors
-        print(json.dumps({"permissionDecision": "approve"}))
+        _write_response_bytes(_APPROVE_RESPONSE)
         return 0
     finally:
-        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         _log_event(
             "HOOK_COMPLETED",
             {
@@ -483,16 +692,16 @@ def handle_post_tool_use() -> int:
     Copilot postToolUse output:
       {} (no injection) or {"additionalContext": "..."} (injects text)
     """
-    hook_id = str(uuid.uuid4())
+    hook_id = _new_id()
     start_ns = time.perf_counter_ns()
-    stderr_buffer = io.StringIO()
+    stderr_buffer = _stderr_capture()
 
     try:
-        with contextlib.redirect_stderr(stderr_buffer):
-            hook_input, is_empty = _read_and_parse_stdin("post_tool_use")
+        with stderr_buffer:
+            hook_input, is_empty, raw = _read_and_parse_stdin("post_tool_use")
 
             if is_empty or hook_input is None:
-                print(json.dumps({}))
+                _write_response_bytes(_EMPTY_RESPONSE)
                 return 0
 
             _log_event(
@@ -504,37 +713,36 @@ def handle_post_tool_use() -> int:
                 },
             )
 
-            # Copilot protocol: toolArgs instead of tool_input
-            tool_args = hook_input.get("toolArgs", {})
-            prompt = tool_args.get("prompt", "")
-            is_des_task = "DES-VALIDATION" in prompt
-
-            from des.adapters.driven.logging.jsonl_audit_log_reader import (
-                JsonlAuditLogReader,
-            )
-            from des.application.post_tool_use_service import PostToolUseService
+            # The byte probe on the raw payload settles the common non-DES
+            # case without touching the decoded prompt.
+            is_des_task = _DES_VALIDATION_MARKER in raw
+            if is_des_task:
+                # Copilot protocol: toolArgs instead of tool_input
+                tool_args = hook_input.get("toolArgs", {})
+                prompt = tool_args.get("prompt", "")
+                is_des_task = "DES-VALIDATION" in prompt
 
-            service = PostToolUseService(audit_reader=JsonlAuditLogReader())
+            service = create_post_tool_use_service()
             additional_context = service.check_completion_status(
                 is_des_task=is_des_task,
             )
 
             if additional_context:
-                print(json.dumps({"additionalContext": additional_context}))
+                _write_response({"additionalContext": additional_context})
             else:
-                print(json.dumps({}))
+                _write_response_bytes(_EMPTY_RESPONSE)
             return 0
 
     except Exception as e:
-        stderr_capture = stderr_buffer.getvalue()[:_STDERR_CAPTURE_MAX_CHARS]
+        stderr_capture = stderr_buffer.getvalue()
         _log_event(
             "HOOK_ERROR",
             {"handler": "post_tool_use", "error": str(e), "stderr": stderr_capture},
         )
-        print(json.dumps({}))
+        _write_response_bytes(_EMPTY_RESPONSE)
         return 0
     finally:
-        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         _log_event(
             "HOOK_COMPLETED",
             {
@@ -571,7 +779,12 @@ def main() -> None:
         print(f"Unknown command: {command}", file=sys.stderr)
         sys.exit(1)
 
-    sys.exit(handler())
+    exit_code = handler()
+    # The handler has already written its response and measured duration_ms;
+    # buffered audit events are appended once here, off that measured path.
+    # A drain thread would not help: the host still waits for process exit.
+    _flush_audit_log()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
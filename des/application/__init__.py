@@ -4,9 +4,26 @@ DES Application Layer - Use cases and orchestration.
 Exports all application-layer services and orchestrator.
 """
 
-from des.application.config_loader import ConfigLoader
-from des.application.orchestrator import DESOrchestrator
-from des.application.validator import TDDPhaseValidator
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from des._lazy import lazy_exports
+
+
+if TYPE_CHECKING:
+    from des.application.config_loader import ConfigLoader
+    from des.application.orchestrator import DESOrchestrator
+    from des.application.validator import TDDPhaseValidator
+
+
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "ConfigLoader": ("des.application.config_loader", "ConfigLoader"),
+    "DESOrchestrator": ("des.application.orchestrator", "DESOrchestrator"),
+    "TDDPhaseValidator": ("des.application.validator", "TDDPhaseValidator"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 
 __all__ = [
@@ -7,12 +7,43 @@ ensuring agents can only modify files relevant to their assigned tasks.
 
 import json
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _read_step_json(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """
+    Parse a step file, memoized by its stat signature.
+
+    The mtime and size are part of the cache key so an edited step file is
+    re-parsed on the next load. Callers must treat the result as read-only.
+    """
+    return json.loads(Path(path).read_bytes())
+
+
+def _to_glob_pattern(file_path: str) -> str:
+    """
+    Convert exact file path to flexible glob pattern.
+
+    Extracts the class/module name from the path and creates a pattern
+    that matches files with that name in any directory. Uses os.path
+    string helpers rather than building a Path per file.
+
+    Examples:
+        "src/repositories/UserRepository.py" -> "**/UserRepository*"
+        "src/repositories/interfaces/IUserRepository.py" -> "**/IUserRepository*"
+        "tests/unit/test_user_repository.py" -> "**/test_user_repository*"
+    """
+    filename = os.path.splitext(os.path.basename(file_path))[0]
+    return f"**/{filename}*"
+
+
 class BoundaryRulesGenerator:
     """
     Generate ALLOWED file patterns from step file scope.
@@ -58,63 +89,34 @@ class BoundaryRulesGenerator:
         """
         self._load_step_file()
 
-        patterns = []
-
         # Always include step file
-        patterns.append(str(self.step_file_path))
+        patterns = [str(self.step_file_path)]
 
         scope = self._step_data.get("scope")
         if not scope:
             logger.warning(
-                f"Step file {self.step_file_path} missing scope field. "
-                f"Using default patterns: {self.DEFAULT_PATTERNS}"
+                "Step file %s missing scope field. Using default patterns: %s",
+                self.step_file_path,
+                self.DEFAULT_PATTERNS,
             )
             patterns.extend(self.DEFAULT_PATTERNS)
             return patterns
 
-        # Add target files (converted to glob patterns)
-        target_files = scope.get("target_files", [])
-        for target_file in target_files:
-            patterns.append(self._convert_to_glob_pattern(target_file))
-
-        # Add test files (converted to glob patterns)
-        test_files = scope.get("test_files", [])
-        for test_file in test_files:
-            patterns.append(self._convert_to_glob_pattern(test_file))
-
-        # Add custom allowed patterns (used as-is)
-        allowed_patterns = scope.get("allowed_patterns", [])
-        patterns.extend(allowed_patterns)
+        # Target and test files become glob patterns; custom allowed
+        # patterns are used as-is
+        patterns.extend(
+            _to_glob_pattern(file_path)
+            for key in ("target_files", "test_files")
+            for file_path in scope.get(key, [])
+        )
+        patterns.extend(scope.get("allowed_patterns", []))
 
         return patterns
 
-    def _convert_to_glob_pattern(self, file_path: str) -> str:
-        """
-        Convert exact file path to flexible glob pattern.
-
-        Extracts the class/module name from the path and creates a pattern
-        that matches files with that name in any directory.
-
-        Args:
-            file_path: Exact file path like "src/repositories/UserRepository.py"
-
-        Returns:
-            Glob pattern like "**/UserRepository*"
-
-        Examples:
-            "src/repositories/UserRepository.py" -> "**/UserRepository*"
-            "src/repositories/interfaces/IUserRepository.py" -> "**/IUserRepository*"
-            "tests/unit/test_user_repository.py" -> "**/test_user_repository*"
-        """
-        # Extract filename from path
-        path = Path(file_path)
-        filename = path.stem  # Gets filename without extension
-
-        # Create glob pattern
-        return f"**/{filename}*"
-
     def _load_step_file(self) -> None:
         """Load step file JSON data."""
         if self._step_data is None:
-            with open(self.step_file_path) as f:
-                self._step_data = json.load(f)
+            stat = self.step_file_path.stat()
+            self._step_data = _read_step_json(
+                str(self.step_file_path), stat.st_mtime_ns, stat.st_size
+            )
@@ -21,12 +21,14 @@ Integration: US-003 Post-Execution Validation
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 from des.adapters.driven.logging.audit_events import AuditEvent, EventType
 from des.adapters.driven.logging.jsonl_audit_log_writer import JsonlAuditLogWriter
 from des.application.stale_execution_detector import StaleExecutionDetector
+from des.domain.audit_log_path_resolver import resolve_audit_log_dir
 from des.domain.des_marker_generator import DESMarkerGenerator
 from des.domain.invocation_limits_validator import (
     InvocationLimitsResult,
@@ -111,6 +113,23 @@ class _NoOpHook(HookPort):
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=8)
+def _audit_writer_for(log_dir: Path) -> JsonlAuditLogWriter:
+    """Return the process-wide writer for a resolved audit log directory.
+
+    Keyed by directory so a changed cwd or DES_AUDIT_LOG_DIR still gets
+    its own writer, while repeated events reuse the open log file.
+    """
+    return JsonlAuditLogWriter(log_dir=log_dir)
+
+
+@lru_cache(maxsize=1)
+def _time_provider() -> TimeProvider:
+    from des.adapters.driven.time.system_time import SystemTimeProvider
+
+    return SystemTimeProvider()
+
+
 def _log_audit_event(event_type: str, **kwargs: object) -> None:
     """Log an audit event using JsonlAuditLogWriter.
 
@@ -121,13 +140,11 @@ def _log_audit_event(event_type: str, **kwargs: object) -> None:
     as direct :class:`PortAuditEvent` fields for structured traceability.
     All remaining kwargs are placed in the ``data`` dict.
     """
-    from des.adapters.driven.time.system_time import SystemTimeProvider
-
     feature_name = kwargs.pop("feature_name", None)
     step_id = kwargs.pop("step_id", None)
 
-    writer = JsonlAuditLogWriter()
-    timestamp = SystemTimeProvider().now_utc().isoformat()
+    writer = _audit_writer_for(resolve_audit_log_dir())
+    timestamp = _time_provider().now_utc().isoformat()
     writer.log_event(
         PortAuditEvent(
             event_type=event_type,
@@ -274,10 +291,9 @@ class DESOrchestrator:
             DESOrchestrator instance with default dependencies configured
         """
         from des.adapters.driven.filesystem.real_filesystem import RealFileSystem
-        from des.adapters.driven.time.system_time import SystemTimeProvider
         from des.application.validator import TemplateValidator
 
-        time_provider = SystemTimeProvider()
+        time_provider = _time_provider()
         # Production validation now runs through claude_code_hook_adapter ->
         # SubagentStopService, so the orchestrator uses a no-op hook.
         hook = _NoOpHook()
@@ -374,7 +390,7 @@ class DESOrchestrator:
         if not config.audit_logging_enabled:
             return
 
-        writer = JsonlAuditLogWriter()
+        writer = _audit_writer_for(resolve_audit_log_dir())
         excluded_keys = ("event", "timestamp", "feature_name", "step_id")
         data = {
             k: v
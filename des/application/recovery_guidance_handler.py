@@ -458,7 +458,7 @@ class RecoveryGuidanceHandler:
 
         # Load step file
         step_file = Path(step_file_path)
-        step_data = json.loads(step_file.read_text())
+        step_data = json.loads(step_file.read_bytes())
 
         # Update step state with recovery suggestions
         if "state" not in step_data:
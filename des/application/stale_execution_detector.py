@@ -137,7 +137,7 @@ class StaleExecutionDetector:
             KeyError: If required fields are missing
             ValueError: If timestamp parsing fails
         """
-        step_data = json.loads(step_file.read_text())
+        step_data = json.loads(step_file.read_bytes())
 
         # Only check IN_PROGRESS steps
         if step_data.get("state", {}).get("status") != "IN_PROGRESS":
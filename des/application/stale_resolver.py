@@ -75,7 +75,7 @@ class StaleResolver:
         if not step_path.exists():
             raise FileNotFoundError(f"Step file not found: {step_path}")
 
-        step_data = json.loads(step_path.read_text())
+        step_data = json.loads(step_path.read_bytes())
 
         # Update state
         step_data["state"]["status"] = "ABANDONED"
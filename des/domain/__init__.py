@@ -4,21 +4,55 @@ DES Domain Layer - Business logic and entities.
 Exports all domain-layer entities and services.
 """
 
-from des.domain.invocation_limits_validator import (
-    InvocationLimitsResult,
-    InvocationLimitsValidator,
-)
-from des.domain.tdd_schema import (
-    TDDSchema,
-    TDDSchemaLoader,
-    TDDSchemaProtocol,
-    get_tdd_schema,
-    get_tdd_schema_loader,
-    reset_global_schema_loader,
-)
-from des.domain.timeout_monitor import TimeoutMonitor
-from des.domain.turn_config import TurnLimitConfig
-from des.domain.turn_counter import TurnCounter
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from des._lazy import lazy_exports
+
+
+if TYPE_CHECKING:
+    from des.domain.invocation_limits_validator import (
+        InvocationLimitsResult,
+        InvocationLimitsValidator,
+    )
+    from des.domain.tdd_schema import (
+        TDDSchema,
+        TDDSchemaLoader,
+        TDDSchemaProtocol,
+        get_tdd_schema,
+        get_tdd_schema_loader,
+        reset_global_schema_loader,
+    )
+    from des.domain.timeout_monitor import TimeoutMonitor
+    from des.domain.turn_config import TurnLimitConfig
+    from des.domain.turn_counter import TurnCounter
+
+
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "InvocationLimitsResult": (
+        "des.domain.invocation_limits_validator",
+        "InvocationLimitsResult",
+    ),
+    "InvocationLimitsValidator": (
+        "des.domain.invocation_limits_validator",
+        "InvocationLimitsValidator",
+    ),
+    "TDDSchema": ("des.domain.tdd_schema", "TDDSchema"),
+    "TDDSchemaLoader": ("des.domain.tdd_schema", "TDDSchemaLoader"),
+    "TDDSchemaProtocol": ("des.domain.tdd_schema", "TDDSchemaProtocol"),
+    "get_tdd_schema": ("des.domain.tdd_schema", "get_tdd_schema"),
+    "get_tdd_schema_loader": ("des.domain.tdd_schema", "get_tdd_schema_loader"),
+    "reset_global_schema_loader": (
+        "des.domain.tdd_schema",
+        "reset_global_schema_loader",
+    ),
+    "TimeoutMonitor": ("des.domain.timeout_monitor", "TimeoutMonitor"),
+    "TurnLimitConfig": ("des.domain.turn_config", "TurnLimitConfig"),
+    "TurnCounter": ("des.domain.turn_counter", "TurnCounter"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 
 __all__ = [
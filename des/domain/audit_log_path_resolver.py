@@ -15,6 +15,7 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -78,10 +79,57 @@ class AuditLogPathResolver:
         config_file = cwd / ".nwave" / "des-config.json"
         if config_file.exists():
             try:
-                config = json.loads(config_file.read_text(encoding="utf-8"))
+                config = json.loads(config_file.read_bytes())
                 audit_dir = config.get("audit_log_dir")
                 if audit_dir:
                     return Path(audit_dir)
             except (json.JSONDecodeError, OSError):
                 pass
         return None
+
+
+def resolve_audit_log_dir(
+    log_dir: str | Path | None = None,
+    cwd: str | Path | None = None,
+) -> Path:
+    """Resolve the audit log directory, memoized for the process.
+
+    Writers and readers are constructed repeatedly (several per hook
+    invocation), and each fresh resolution probes the environment and
+    stats/reads the config file. The cache key covers the explicit
+    arguments, the effective cwd, DES_AUDIT_LOG_DIR and, when it can decide
+    the result, des-config.json's (mtime_ns, size), so editing the config
+    re-resolves at the cost of one stat.
+
+    Args:
+        log_dir: Explicit log directory (highest priority)
+        cwd: Working directory override
+
+    Returns:
+        Path to audit log directory
+    """
+    explicit = str(log_dir) if log_dir else None
+    effective_cwd = str(cwd) if cwd else os.getcwd()
+    env_dir = os.environ.get("DES_AUDIT_LOG_DIR")
+
+    config_signature = None
+    if not explicit and not env_dir:
+        try:
+            stat = os.stat(os.path.join(effective_cwd, ".nwave", "des-config.json"))
+            config_signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pass
+
+    return _resolve_cached(explicit, effective_cwd, env_dir, config_signature)
+
+
+@lru_cache(maxsize=32)
+def _resolve_cached(
+    log_dir: str | None,
+    cwd: str,
+    env_dir: str | None,
+    config_signature: tuple[int, int] | None,
+) -> Path:
+    # env_dir and config_signature are part of the key only; the resolver
+    # reads the environment and the config file itself
+    return AuditLogPathResolver(log_dir=log_dir, cwd=cwd).resolve()
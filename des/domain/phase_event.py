@@ -174,3 +174,18 @@ class PhaseEventParser:
             if event is not None:
                 events.append(event)
         return events
+
+    @staticmethod
+    def index_by_step(events: list[PhaseEvent]) -> dict[str, list[PhaseEvent]]:
+        """Group already-parsed events by step_id, preserving order.
+
+        Args:
+            events: Parsed PhaseEvent objects
+
+        Returns:
+            Dict mapping step_id to its PhaseEvent objects
+        """
+        index: dict[str, list[PhaseEvent]] = {}
+        for event in events:
+            index.setdefault(event.step_id, []).append(event)
+        return index
@@ -6,17 +6,35 @@ with external systems and infrastructure.
 Re-exports all port abstractions from driver and driven port layers for convenience.
 """
 
-from des.ports.driven_ports import (
-    ConfigPort,
-    FileSystemPort,
-    LoggingPort,
-    TaskInvocationPort,
-    TimeProvider,
-)
-from des.ports.driver_ports import (
-    HookPort,
-    ValidatorPort,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from des._lazy import lazy_exports
+
+
+if TYPE_CHECKING:
+    from des.ports.driven_ports import (
+        ConfigPort,
+        FileSystemPort,
+        LoggingPort,
+        TaskInvocationPort,
+        TimeProvider,
+    )
+    from des.ports.driver_ports import HookPort, ValidatorPort
+
+
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "ConfigPort": ("des.ports.driven_ports", "ConfigPort"),
+    "FileSystemPort": ("des.ports.driven_ports", "FileSystemPort"),
+    "LoggingPort": ("des.ports.driven_ports", "LoggingPort"),
+    "TaskInvocationPort": ("des.ports.driven_ports", "TaskInvocationPort"),
+    "TimeProvider": ("des.ports.driven_ports", "TimeProvider"),
+    "HookPort": ("des.ports.driver_ports", "HookPort"),
+    "ValidatorPort": ("des.ports.driver_ports", "ValidatorPort"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 
 __all__ = [
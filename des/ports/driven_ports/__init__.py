@@ -4,11 +4,33 @@ DES Driven Ports - Outbound/Secondary port abstractions.
 Exports all driven port interfaces (ports that DES depends on).
 """
 
-from des.ports.driven_ports.config_port import ConfigPort
-from des.ports.driven_ports.filesystem_port import FileSystemPort
-from des.ports.driven_ports.logging_port import LoggingPort
-from des.ports.driven_ports.task_invocation_port import TaskInvocationPort
-from des.ports.driven_ports.time_provider_port import TimeProvider
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from des._lazy import lazy_exports
+
+
+if TYPE_CHECKING:
+    from des.ports.driven_ports.config_port import ConfigPort
+    from des.ports.driven_ports.filesystem_port import FileSystemPort
+    from des.ports.driven_ports.logging_port import LoggingPort
+    from des.ports.driven_ports.task_invocation_port import TaskInvocationPort
+    from des.ports.driven_ports.time_provider_port import TimeProvider
+
+
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "ConfigPort": ("des.ports.driven_ports.config_port", "ConfigPort"),
+    "FileSystemPort": ("des.ports.driven_ports.filesystem_port", "FileSystemPort"),
+    "LoggingPort": ("des.ports.driven_ports.logging_port", "LoggingPort"),
+    "TaskInvocationPort": (
+        "des.ports.driven_ports.task_invocation_port",
+        "TaskInvocationPort",
+    ),
+    "TimeProvider": ("des.ports.driven_ports.time_provider_port", "TimeProvider"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 
 __all__ = [
@@ -9,6 +9,9 @@ class FileSystemPort(ABC):
     def read_json(self, path: Path) -> dict:
         """Read and parse JSON file.
 
+        Each call returns a dictionary owned by the caller; mutating it
+        must not affect what a later read returns.
+
         Args:
             path: Absolute path to JSON file
 
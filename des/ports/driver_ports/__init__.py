@@ -4,10 +4,28 @@ DES Driver Ports - Inbound/Primary port abstractions.
 Exports all driver port interfaces (ports that DES exposes to callers).
 """
 
-from des.application.orchestrator import HookPort
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from des.ports.driver_ports.validator_port import ValidatorPort
 
 
+if TYPE_CHECKING:
+    from des.application.orchestrator import HookPort
+
+
+def __getattr__(name: str) -> Any:
+    # HookPort lives in the application layer; resolving it lazily keeps the
+    # ports package importable without pulling in (and cycling through) it.
+    if name == "HookPort":
+        from des.application.orchestrator import HookPort
+
+        globals()["HookPort"] = HookPort
+        return HookPort
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "HookPort",
     "ValidatorPort",